@@ -54,6 +54,17 @@ def find_cached_models():
     return cached
 
 
+def _install_uvloop():
+    """Use uvloop for the Textual event loop if it's installed (not available on Windows)."""
+    try:
+        import asyncio
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+
+
 def run_app(args):
     """Run application with Textual UI"""
     import threading
@@ -62,7 +73,7 @@ def run_app(args):
     from utils.keyboard_shortcuts import KeyboardShortcutManager
     from utils.audio import AudioManager
     from model_loader import get_model
-    from transcription import transcription_worker
+    from transcription import transcription_worker, console_printer
     from hotkeys import on_activate
     from ui import CtrlSpeakApp, AppState
 
@@ -161,12 +172,21 @@ def run_app(args):
 
         state.transcription_worker_thread = threading.Thread(
             target=transcription_worker,
-            args=(state.stt_model, state.transcription_queue, state.transcribed_chunks, state.source_lang, state.target_lang),
+            args=(state.stt_model, state.transcription_queue, state.transcribed_chunks, state.source_lang, state.target_lang,
+                  state.print_queue),
             daemon=True,
             name="TranscriptionWorker",
         )
         state.transcription_worker_thread.start()
 
+        state.console_printer_thread = threading.Thread(
+            target=console_printer,
+            args=(state.print_queue,),
+            daemon=True,
+            name="ConsolePrinter",
+        )
+        state.console_printer_thread.start()
+
         state.keyboard_manager.start_listening()
 
         # Start audio stream
@@ -189,6 +209,7 @@ def run_app(args):
             )
 
             # Run the app (this blocks until app exits)
+            _install_uvloop()
             app.run()
 
             logger.info("Textual UI exited, cleaning up...")
@@ -223,6 +244,15 @@ def run_app(args):
             if state.transcription_worker_thread.is_alive():
                 logger.warning("Finally: Transcription worker thread did NOT join after timeout.")
 
+        # Queued after the worker has exited, so any text it produced is printed first
+        state.print_queue.put(None)
+        if state.console_printer_thread and state.console_printer_thread.is_alive():
+            state.console_printer_thread.join(timeout=1.0)
+
+        # Nothing writes history past this point; close the shared SQLite connection
+        from utils.history import close_history_manager
+        close_history_manager()
+
         if 'saved_env_vars' in locals():
             restore_environment_variables(saved_env_vars)
 
@@ -87,6 +87,8 @@ def on_activate():
             _current_session_streaming = False
             _start_queue_recording()
 
+        state.ui_update_event.set()
+
     else:
         # =================================================================
         # STOP RECORDING
@@ -100,6 +102,7 @@ def on_activate():
             final_text = streaming.stop_streaming()
         else:
             final_text = _stop_queue_recording()
+        state.ui_update_event.set()
 
         # Handle final text
         if final_text:
@@ -2,6 +2,7 @@
 import time
 import traceback
 import logging
+import numpy as np
 import state
 from models.factory import ModelFactory
 
@@ -12,6 +13,18 @@ class ModelLoadError(Exception):
     pass
 
 
+def _warm_up_streaming(model):
+    """Run one silent chunk through a streaming model and reset its state.
+
+    Moves first-call costs (kernel selection, allocator growth, lazy init) to
+    load time instead of the user's first recording.
+    """
+    chunk_samples = int(16000 * model.chunk_size_ms / 1000)
+    model.init_streaming()
+    model.stream_chunk(np.zeros(chunk_samples, dtype=np.float32))
+    model.finalize_streaming()
+
+
 def get_model():
     """
     Load model with progress tracking.
@@ -56,6 +69,14 @@ def get_model():
                 traceback.print_exc()
             raise ModelLoadError(error_msg)
 
+        if getattr(state.stt_model, 'supports_streaming', False):
+            logger.info("Step 3: Warming up streaming inference...")
+            try:
+                _warm_up_streaming(state.stt_model)
+            except Exception as e:
+                # Warm-up is an optimization only; the model is still usable
+                logger.warning(f"Streaming warm-up failed: {e}")
+
         end_time = time.time()
         state.model_loaded = True
         state.console.print(f"[bold green]Model loaded in {end_time - start_time:.2f} seconds. Ready to record![/bold green]")
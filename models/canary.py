@@ -121,11 +121,11 @@ class CanaryModel(BaseSTTModel):
             
             # Log audio file details
             for i, path in enumerate(audio_paths):
-                if os.path.exists(path):
-                    file_size = os.path.getsize(path) / 1024
-                    logger.debug(f"Audio file {i+1}: {path} ({file_size:.2f} KB)")
-                else:
+                if not os.path.exists(path):
                     logger.warning(f"Audio file {i+1}: {path} does not exist")
+                elif logger.isEnabledFor(logging.DEBUG):
+                    file_size = os.path.getsize(path) / 1024
+                    logger.debug("Audio file %d: %s (%.2f KB)", i + 1, path, file_size)
             
             # Transcribe with AMP support
             logger.debug("Starting transcription...")
@@ -137,7 +137,7 @@ class CanaryModel(BaseSTTModel):
                     raw_result = self.model.transcribe(audio_paths, verbose=False)
             
             transcribe_time = time.time() - transcribe_start
-            logger.debug(f"Transcription completed in {transcribe_time:.2f} seconds")
+            logger.debug("Transcription completed in %.2f seconds", transcribe_time)
             
             # Clean up each result
             # Handle both old API (Hypothesis objects with .text) and new API (strings)
@@ -5,6 +5,7 @@ import logging
 import importlib.util
 import platform
 import sys
+import threading
 
 # Configure logging
 logger = logging.getLogger("model_factory")
@@ -39,6 +40,10 @@ class ModelFactory:
         "whisper": OPENAI_WHISPER_V3
     }
 
+    # Loaded models kept by get_loaded_model, keyed on (model_type, device, verbose)
+    _model_cache = {}
+    _model_cache_lock = threading.Lock()
+
     @classmethod
     def resolve_model_alias(cls, model_name: str) -> str:
         """Resolves a potential model alias to its specific model name."""
@@ -156,4 +161,38 @@ class ModelFactory:
                 ) from e
         else:
             logger.error(f"Unsupported model type: {model_type}")
-            raise ValueError(f"Unsupported model type: {model_type}")
\ No newline at end of file
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+    @classmethod
+    def get_loaded_model(cls, model_type, device=None, verbose=False):
+        """Get a model with its weights loaded, reusing one loaded earlier.
+
+        Meant for scripts and tests that would otherwise pay the multi-second
+        load for the same model repeatedly. The app itself uses ``get_model``
+        so that switching models actually frees the old one.
+
+        Args:
+            model_type: The specific type of model (aliases should be resolved beforehand).
+            device: The device to run the model on.
+            verbose: Whether to enable verbose logging.
+
+        Returns:
+            A loaded speech-to-text model, shared with other callers using the same arguments.
+        """
+        key = (model_type.lower(), str(device), verbose)
+        # Held across the load so concurrent callers wait for one load instead of racing
+        with cls._model_cache_lock:
+            model = cls._model_cache.get(key)
+            if model is None:
+                model = cls.get_model(model_type=model_type, device=device, verbose=verbose)
+                model.load_model()
+                cls._model_cache[key] = model
+            else:
+                logger.debug(f"Reusing loaded model: {model_type}")
+            return model
+
+    @classmethod
+    def clear_model_cache(cls):
+        """Drop the models kept by ``get_loaded_model``."""
+        with cls._model_cache_lock:
+            cls._model_cache.clear()
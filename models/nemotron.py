@@ -22,6 +22,7 @@ logger = logging.getLogger("nemotron_model")
 
 # Streaming configuration defaults
 DEFAULT_CHUNK_SIZE_MS = 1120  # 14 frames at 80ms each - best accuracy
+DEFAULT_SILENCE_GATE_THRESHOLD = 1e-3  # Peak amplitude below which a chunk counts as silence
 SAMPLE_RATE = 16000  # Required by NeMo models
 
 
@@ -56,6 +57,13 @@ class NemotronModel(BaseSTTModel):
         self._chunk_size_ms: int = DEFAULT_CHUNK_SIZE_MS
         self._step_num: int = 0  # Track step number for drop_extra_pre_encoded
 
+        # Streaming chunks quieter than this are skipped by the streaming pipeline (None disables)
+        self.silence_gate_threshold: Optional[float] = DEFAULT_SILENCE_GATE_THRESHOLD
+
+        # Pinned host staging buffer for CUDA uploads (grown on demand, reused across chunks)
+        self._pinned_staging: Optional[torch.Tensor] = None
+        self._staging_copy_done: Optional[Any] = None  # torch.cuda.Event guarding buffer reuse
+
         if self.verbose:
             logger.setLevel(logging.DEBUG)
         else:
@@ -104,11 +112,11 @@ class NemotronModel(BaseSTTModel):
 
             # Log audio file details
             for i, path in enumerate(audio_paths):
-                if os.path.exists(path):
-                    file_size = os.path.getsize(path) / 1024
-                    logger.debug(f"Audio file {i+1}: {path} ({file_size:.2f} KB)")
-                else:
+                if not os.path.exists(path):
                     logger.warning(f"Audio file {i+1}: {path} does not exist")
+                elif logger.isEnabledFor(logging.DEBUG):
+                    file_size = os.path.getsize(path) / 1024
+                    logger.debug("Audio file %d: %s (%.2f KB)", i + 1, path, file_size)
 
             # Transcribe using NeMo's transcribe method
             logger.debug("Starting transcription...")
@@ -135,7 +143,7 @@ class NemotronModel(BaseSTTModel):
             if self.verbose:
                 logger.debug("=== Transcription Results ===")
                 for i, text in enumerate(transcriptions):
-                    logger.debug(f"Transcription {i+1}: {text}")
+                    logger.debug("Transcription %d: %s", i + 1, text)
 
             end_time = time.time()
             logger.info(f"Transcription completed in {end_time - start_time:.2f} seconds")
@@ -266,14 +274,15 @@ class NemotronModel(BaseSTTModel):
             if is_final and len(audio_samples) < MIN_FINAL_SAMPLES:
                 padding_needed = MIN_FINAL_SAMPLES - len(audio_samples)
                 audio_samples = np.pad(audio_samples, (0, padding_needed), mode='constant', constant_values=0)
-                logger.debug(f"[STREAM] Padded final chunk to {len(audio_samples)} samples")
+                logger.debug("[STREAM] Padded final chunk to %d samples", len(audio_samples))
 
             # Preprocess audio to model input format
             processed_signal, processed_signal_length = self._preprocess_audio(audio_samples)
 
             # Log cache state for debugging
-            cache_shape = self._cache_last_channel.shape if self._cache_last_channel is not None else "None"
-            logger.debug(f"[STREAM] Step {self._step_num}, cache shape: {cache_shape}")
+            if logger.isEnabledFor(logging.DEBUG):
+                cache_shape = self._cache_last_channel.shape if self._cache_last_channel is not None else "None"
+                logger.debug("[STREAM] Step %d, cache shape: %s", self._step_num, cache_shape)
 
             # Calculate drop_extra_pre_encoded based on step number
             # First step: 0, subsequent steps: use model's config value
@@ -286,10 +295,13 @@ class NemotronModel(BaseSTTModel):
                 else:
                     drop_extra = 0
 
-            logger.debug(f"[STREAM] drop_extra_pre_encoded={drop_extra}, is_final={is_final}")
+            logger.debug("[STREAM] drop_extra_pre_encoded=%s, is_final=%s", drop_extra, is_final)
 
             # Run streaming inference step
             # keep_all_outputs=True for final chunk to flush decoder state
+            # releases GIL: torch's C++ kernels drop the GIL per op, so the audio
+            # callback and other model threads keep running during the encoder pass
+            # (the RNNT greedy decode loop is Python and holds it between ops)
             with torch.no_grad():
                 (
                     self._pred_out_stream,
@@ -315,8 +327,9 @@ class NemotronModel(BaseSTTModel):
             self._step_num += 1
 
             # Log cache state after for debugging
-            cache_shape_after = self._cache_last_channel.shape if self._cache_last_channel is not None else "None"
-            logger.debug(f"[STREAM] Cache shape after: {cache_shape_after}")
+            if logger.isEnabledFor(logging.DEBUG):
+                cache_shape_after = self._cache_last_channel.shape if self._cache_last_channel is not None else "None"
+                logger.debug("[STREAM] Cache shape after: %s", cache_shape_after)
 
             # Extract text from result
             # conformer_stream_step returns Hypothesis objects, not strings
@@ -332,7 +345,7 @@ class NemotronModel(BaseSTTModel):
 
                 if new_text:
                     self._accumulated_text = new_text
-                    logger.debug(f"Streaming transcription: {new_text}")
+                    logger.debug("Streaming transcription: %s", new_text)
 
             return self._accumulated_text
 
@@ -391,11 +404,11 @@ class NemotronModel(BaseSTTModel):
         if np.abs(audio_samples).max() > 1.0:
             audio_samples = audio_samples / 32768.0
 
-        # Convert to tensor [batch, time]
-        audio_tensor = torch.from_numpy(audio_samples).unsqueeze(0)
+        # Convert to tensor [batch, time] on the model's device
+        audio_tensor = self._to_model_device(audio_samples)
 
         # Get signal length
-        audio_length = torch.tensor([audio_tensor.shape[1]], dtype=torch.long)
+        audio_length = torch.tensor([audio_tensor.shape[1]], dtype=torch.long, device=audio_tensor.device)
 
         # Use model's preprocessor if available
         if hasattr(self.model, 'preprocessor') and self.model.preprocessor is not None:
@@ -409,3 +422,39 @@ class NemotronModel(BaseSTTModel):
             processed_signal_length = audio_length
 
         return processed_signal, processed_signal_length
+
+    def _to_model_device(self, audio_samples: np.ndarray) -> torch.Tensor:
+        """Move audio samples to the model's device as a [1, time] tensor.
+
+        On CUDA the samples are staged through a reusable pinned host buffer
+        so the upload can be issued with ``non_blocking=True``. Stream steps
+        depend on each other's cache, so the copy stays on the current stream;
+        the win is skipping the pageable-memory bounce, not overlap.
+
+        Args:
+            audio_samples: float32 numpy array (16kHz mono).
+
+        Returns:
+            Audio tensor of shape [1, time].
+        """
+        audio_tensor = torch.from_numpy(audio_samples).unsqueeze(0)
+        device = getattr(self.model, 'device', None)
+        if device is None or device.type != 'cuda':
+            return audio_tensor if device is None else audio_tensor.to(device)
+
+        num_samples = audio_tensor.shape[1]
+        if self._pinned_staging is None or self._pinned_staging.shape[1] < num_samples:
+            self._pinned_staging = torch.empty((1, num_samples), dtype=torch.float32, pin_memory=True)
+            self._staging_copy_done = None
+        elif self._staging_copy_done is not None:
+            # Don't overwrite the buffer while the previous upload may still be reading it
+            self._staging_copy_done.synchronize()
+
+        staging = self._pinned_staging[:, :num_samples]
+        staging.copy_(audio_tensor)
+        device_tensor = staging.to(device, non_blocking=True)
+
+        if self._staging_copy_done is None:
+            self._staging_copy_done = torch.cuda.Event()
+        self._staging_copy_done.record()
+        return device_tensor
@@ -12,6 +12,9 @@ from typing import List
 # Configure logging
 logger = logging.getLogger("parakeet_model")
 
+# Upper bound for NeMo's transcribe() batch size (NeMo defaults to 4)
+MAX_BATCH_SIZE = 16
+
 class ParakeetModel(BaseSTTModel):
     """Parakeet TDT model family for speech-to-text."""
 
@@ -27,6 +30,8 @@ class ParakeetModel(BaseSTTModel):
         self.model_name = model_name
         self.model = None
         self.verbose = verbose
+        # Output post-processor, resolved from the first NeMo result (see _resolve_postprocessor)
+        self._postprocess = None
         
         if self.verbose:
             logger.setLevel(logging.DEBUG)
@@ -59,7 +64,8 @@ class ParakeetModel(BaseSTTModel):
         
         Args:
             audio_paths: List of paths to audio files.
-            **kwargs: Additional arguments (ignored for compatibility).
+            **kwargs: Additional arguments. ``batch_size`` overrides the NeMo
+                batch size; anything else is ignored for compatibility.
             
         Returns:
             List of clean string transcriptions.
@@ -74,43 +80,54 @@ class ParakeetModel(BaseSTTModel):
             start_time = time.time()
             
             # Log audio file details
+            file_sizes = []
             for i, path in enumerate(audio_paths):
                 if os.path.exists(path):
                     file_size = os.path.getsize(path) / 1024
-                    logger.debug(f"Audio file {i+1}: {path} ({file_size:.2f} KB)")
+                    logger.debug("Audio file %d: %s (%.2f KB)", i + 1, path, file_size)
                 else:
+                    file_size = 0.0
                     logger.warning(f"Audio file {i+1}: {path} does not exist")
+                file_sizes.append(file_size)
             
+            # Sort inputs by length so each batch pads to similar durations
+            order = sorted(range(len(audio_paths)), key=lambda i: file_sizes[i])
+            sorted_paths = [audio_paths[i] for i in order]
+
+            batch_size = kwargs.get("batch_size") or min(len(audio_paths), MAX_BATCH_SIZE)
+            # Dataloader workers only pay off on CUDA; on MPS/CPU the fork overhead dominates
+            num_workers = 2 if torch.cuda.is_available() else 0
+
             # Transcribe using NeMo's direct transcribe method
-            logger.debug("Starting transcription...")
+            logger.debug("Starting transcription (batch_size=%d, num_workers=%d)...", batch_size, num_workers)
             transcribe_start = time.time()
             
             # Let NeMo handle the transcription
             # Pass verbose=False to disable tqdm progress bar which causes multiprocessing issues
-            raw_transcriptions = self.model.transcribe(audio_paths, verbose=False)
+            sorted_transcriptions = self.model.transcribe(
+                sorted_paths,
+                batch_size=batch_size,
+                num_workers=num_workers,
+                return_hypotheses=False,
+                verbose=False,
+            )
+
+            # Restore the caller's ordering
+            raw_transcriptions = [None] * len(audio_paths)
+            for position, index in enumerate(order):
+                raw_transcriptions[index] = sorted_transcriptions[position]
             
-            # NeMo 2.2.0+ returns Hypothesis objects, so we need special handling
-            # Check if we're dealing with Hypothesis objects
-            is_hypothesis = False
-            if raw_transcriptions and isinstance(raw_transcriptions, list):
-                if len(raw_transcriptions) > 0 and hasattr(raw_transcriptions[0], 'text'):
-                    is_hypothesis = True
-                    
-            # Handle the Hypothesis objects if needed
-            if is_hypothesis:
-                logger.debug("Handling Hypothesis objects from NeMo 2.2.0+")
-                # Extract just the text from each Hypothesis object
-                text_only = [hyp.text for hyp in raw_transcriptions if hasattr(hyp, 'text')]
-                transcriptions = text_only
-            else:
-                # Clean up each result using the standard method
-                transcriptions = [self._clean_text(text) for text in raw_transcriptions]
+            # NeMo 2.2.0+ returns Hypothesis objects; the output type is fixed
+            # for a given NeMo install, so resolve the handler once and reuse it
+            if self._postprocess is None and raw_transcriptions:
+                self._postprocess = self._resolve_postprocessor(raw_transcriptions[0])
+            transcriptions = self._postprocess(raw_transcriptions) if raw_transcriptions else []
             
             # Log results if in debug mode
             if self.verbose:
                 logger.debug("=== Transcription Results ===")
                 for i, text in enumerate(transcriptions):
-                    logger.debug(f"Transcription {i+1}: {text}")
+                    logger.debug("Transcription %d: %s", i + 1, text)
             
             end_time = time.time()
             logger.info(f"Transcription completed in {end_time - start_time:.2f} seconds")
@@ -123,6 +140,28 @@ class ParakeetModel(BaseSTTModel):
                 logger.error(f"Error during transcription: {str(e)}")
             raise
     
+    def _resolve_postprocessor(self, sample):
+        """Pick the text extraction method matching NeMo's output type.
+
+        Args:
+            sample: One element of a ``transcribe()`` result.
+
+        Returns:
+            Callable mapping the raw result list to clean strings.
+        """
+        if hasattr(sample, 'text'):
+            logger.debug("Handling Hypothesis objects from NeMo 2.2.0+")
+            return self._hypothesis_texts
+        return self._clean_texts
+
+    def _hypothesis_texts(self, hypotheses) -> List[str]:
+        """Extract just the text from each Hypothesis object."""
+        return [hyp.text for hyp in hypotheses if hasattr(hyp, 'text')]
+
+    def _clean_texts(self, texts) -> List[str]:
+        """Clean up each result using the standard method."""
+        return [self._clean_text(text) for text in texts]
+
     def name(self):
         """Return the name of the model."""
         # Extract a clean name like 'parakeet-tdt-0.6b-v2'
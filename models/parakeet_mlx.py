@@ -5,6 +5,8 @@ import time
 import logging
 from typing import List
 
+import numpy as np
+
 from models.base_model import BaseSTTModel
 
 # Configure logging
@@ -64,6 +66,40 @@ class ParakeetMLXModel(BaseSTTModel):
             logger.error(f"Error during transcription: {str(e)}")
             raise
 
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int, **kwargs) -> str:
+        """Transcribe in-memory audio without a WAV file round-trip.
+
+        Mirrors what ``model.transcribe`` does after loading a file: compute the
+        log-mel spectrogram and decode it.
+
+        Args:
+            audio: float32 mono samples.
+            sample_rate: Sample rate of ``audio``; must match the model's.
+            **kwargs: Language arguments, ignored like in ``transcribe_batch``.
+
+        Returns:
+            The transcribed text.
+        """
+        if self.model is None:
+            self.load_model()
+
+        import mlx.core as mx
+        from parakeet_mlx.audio import get_logmel
+
+        expected_rate = self.model.preprocessor_config.sample_rate
+        if sample_rate != expected_rate:
+            raise ValueError(f"Expected {expected_rate} Hz audio, got {sample_rate} Hz")
+
+        try:
+            # releases GIL only while MLX evaluates arrays in native code; the TDT
+            # decode loop in parakeet-mlx is Python, so it competes with other threads
+            mel = get_logmel(mx.array(audio, dtype=mx.float32), self.model.preprocessor_config)
+            result = self.model.generate(mel)[0]
+            return self._clean_text(result.text)
+        except Exception as e:
+            logger.error(f"Error during transcription: {str(e)}")
+            raise
+
     def name(self):
         """Return the name of the model."""
         simple_name = self.model_name.split('/')[-1]
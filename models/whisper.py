@@ -5,6 +5,7 @@ import time
 import os
 import torch
 import logging
+import numpy as np
 from models.base_model import BaseSTTModel
 from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline, WhisperProcessor
 from typing import List
@@ -118,11 +119,11 @@ class WhisperModel(BaseSTTModel):
             
             # Log audio file details
             for i, path in enumerate(audio_paths):
-                if os.path.exists(path):
-                    file_size = os.path.getsize(path) / 1024
-                    logger.debug(f"Audio file {i+1}: {path} ({file_size:.2f} KB)")
-                else:
+                if not os.path.exists(path):
                     logger.warning(f"Audio file {i+1}: {path} does not exist")
+                elif logger.isEnabledFor(logging.DEBUG):
+                    file_size = os.path.getsize(path) / 1024
+                    logger.debug("Audio file %d: %s (%.2f KB)", i + 1, path, file_size)
             
             # Transcribe with AMP support
             logger.debug("Starting transcription...")
@@ -138,7 +139,7 @@ class WhisperModel(BaseSTTModel):
                         transcriptions.append(self._clean_text(result["text"]))
             
             transcribe_time = time.time() - transcribe_start
-            logger.debug(f"Transcription completed in {transcribe_time:.2f} seconds")
+            logger.debug("Transcription completed in %.2f seconds", transcribe_time)
             
             end_time = time.time()
             logger.info(f"Transcription completed in {end_time - start_time:.2f} seconds")
@@ -148,6 +149,32 @@ class WhisperModel(BaseSTTModel):
             logger.error(f"Error during transcription: {str(e)}")
             raise
     
+    def transcribe_array(self, audio: np.ndarray, sample_rate: int, **kwargs) -> str:
+        """Transcribe in-memory audio without a WAV file round-trip.
+
+        Args:
+            audio: float32 mono samples.
+            sample_rate: Sample rate of ``audio``; the pipeline resamples if needed.
+            **kwargs: Additional arguments (ignored for compatibility).
+
+        Returns:
+            The transcribed text.
+        """
+        if self.model is None:
+            self.load_model()
+
+        try:
+            with torch.amp.autocast(self.device.type, dtype=self.amp_dtype, enabled=self.use_amp):
+                with torch.no_grad():
+                    result = self.pipe(
+                        {"raw": audio, "sampling_rate": sample_rate},
+                        generate_kwargs={"language": "<|en|>", "task": "translate"},
+                    )
+            return self._clean_text(result["text"])
+        except Exception as e:
+            logger.error(f"Error during transcription: {str(e)}")
+            raise
+
     @property
     def name(self):
         """Return the name of the model."""
@@ -1,5 +1,6 @@
 
 import queue
+import threading
 from rich.console import Console
 
 # Global variables
@@ -39,8 +40,12 @@ model_type = "parakeet"
 model_loaded = False
 
 transcribed_chunks = []
+# Set whenever transcribed_chunks or the recording state changes, to wake the TUI
+ui_update_event = threading.Event()
 transcription_queue = queue.Queue()
 transcription_worker_thread = None
+print_queue = queue.Queue()  # Transcribed text waiting for the console printer thread
+console_printer_thread = None
 main_loop_active = True
 
 keyboard_manager = None
@@ -6,18 +6,60 @@ Handles real-time streaming transcription for models that support it
 blocking the audio callback.
 """
 
+import ctypes
+import ctypes.util
 import logging
+import sys
 import threading
-import queue
+from collections import deque
 import numpy as np
 import state
 
 logger = logging.getLogger("ctrlspeak.streaming")
 
+# Maximum number of chunks buffered before new chunks are dropped
+_STREAMING_QUEUE_MAX = 50
+
+# macOS QoS class for the streaming worker (qos_class_t QOS_CLASS_USER_INTERACTIVE).
+# Keeps inference on performance cores at some battery cost; recording sessions are short.
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+
+# Silent chunks still sent to the model after speech, so the decoder's
+# right context sees the pause and emits the trailing words
+_SILENCE_FLUSH_CHUNKS = 1
+
 # Streaming worker thread state
+# Single producer (audio callback) / single consumer (worker): deque append/popleft
+# are atomic, so the only synchronization needed is an event to wake the worker.
 _streaming_queue = None
+_chunk_available = None
 _streaming_worker_thread = None
-_streaming_stop_event = None
+
+# Per-session bindings, resolved once in start_streaming instead of per chunk
+_stream_chunk_fn = None  # Bound stream_chunk of the model the session was started with
+_ui_state = None  # UI AppState to mirror text into, if the TUI is running
+
+# Silence gate state (threshold comes from the model's silence_gate_threshold)
+_silence_gate_threshold = None
+_silent_chunk_run = 0
+
+
+def _raise_worker_priority():
+    """Ask the scheduler to treat the calling thread as latency-critical.
+
+    On macOS this sets the thread's QoS to USER_INTERACTIVE so inference is not
+    parked on efficiency cores. No-op elsewhere. PortAudio's callback thread is
+    already real-time on CoreAudio, so only the worker needs this.
+    """
+    if sys.platform != "darwin":
+        return
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        result = libc.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0)
+        if result != 0:
+            logger.debug("pthread_set_qos_class_self_np failed with %d", result)
+    except (OSError, AttributeError) as e:
+        logger.debug("Could not raise streaming worker QoS: %s", e)
 
 
 def _streaming_worker():
@@ -26,71 +68,83 @@ def _streaming_worker():
     Runs in a separate thread to avoid blocking the audio callback.
     Pulls chunks from the queue and processes them through the model.
     """
-    global _streaming_queue, _streaming_stop_event
+    global _streaming_queue, _chunk_available
 
+    _raise_worker_priority()
     logger.info("Streaming worker thread started")
 
     chunk_count = 0
-    while not _streaming_stop_event.is_set():
-        try:
-            # Wait for a chunk with timeout to allow checking stop event
-            queue_item = _streaming_queue.get(timeout=0.1)
+    while True:
+        # Block until a chunk (or the stop sentinel) arrives - stop_streaming always
+        # queues the sentinel, so there is no need to wake up periodically
+        _chunk_available.wait()
+        # Clear before draining: anything appended after this point sets it again
+        _chunk_available.clear()
+
+        while _streaming_queue:
+            queue_item = _streaming_queue.popleft()
 
             if queue_item is None:
                 # Sentinel value - stop processing
                 logger.debug("[WORKER] Received stop sentinel")
-                break
-
-            # Unpack tuple (audio_samples, is_final)
-            audio_samples, is_final = queue_item
+                logger.info("[WORKER] Streaming worker thread stopped after processing %d chunks", chunk_count)
+                return
 
             chunk_count += 1
-            duration_ms = len(audio_samples) / 16000 * 1000
-            # Calculate RMS to verify audio level
-            rms = np.sqrt(np.mean(audio_samples**2))
-            max_amp = np.abs(audio_samples).max()
-            logger.debug(f"[WORKER] Processing chunk #{chunk_count}: {len(audio_samples)} samples ({duration_ms:.0f}ms), RMS={rms:.4f}, max={max_amp:.4f}, is_final={is_final}")
-
-            if state.stt_model is None:
-                logger.warning("Streaming chunk received but no model loaded")
-                _streaming_queue.task_done()
-                continue
-
-            # Process chunk through model's streaming API
-            text = state.stt_model.stream_chunk(audio_samples, is_final=is_final)
-
-            # Update accumulated text (streaming returns cumulative text)
-            if text:
-                # For streaming, the model returns cumulative text, not deltas
-                # So we replace rather than append
-                if state.transcribed_chunks:
-                    state.transcribed_chunks[-1] = text
-                else:
-                    state.transcribed_chunks.append(text)
-
-                # Update UI if available
-                if hasattr(state, 'app_state_ref') and state.app_state_ref:
-                    state.app_state_ref.accumulated_text = text
-
-                if len(text) > 50:
-                    logger.debug(f"[WORKER] Chunk #{chunk_count} result: \"{text[:50]}...\"")
-                else:
-                    logger.debug(f"[WORKER] Chunk #{chunk_count} result: \"{text}\"")
-
-            logger.debug(f"[WORKER] Chunk #{chunk_count} done, calling task_done()")
-            _streaming_queue.task_done()
-
-        except queue.Empty:
-            # Timeout - just continue to check stop event
-            continue
-        except Exception as e:
-            logger.error(f"Error in streaming worker: {e}")
             try:
-                _streaming_queue.task_done()
-            except ValueError:
-                pass
+                _process_chunk(queue_item, chunk_count)
+            except Exception as e:
+                logger.error("Error in streaming worker: %s", e)
+
+
+def _process_chunk(queue_item, chunk_count):
+    """Run one queued chunk through the model and publish the result.
 
-    logger.info(f"[WORKER] Streaming worker thread stopped after processing {chunk_count} chunks")
+    Args:
+        queue_item: tuple of (audio_samples, is_final)
+        chunk_count: 1-based index of this chunk in the session (for logging)
+    """
+    # Unpack tuple (audio_samples, is_final)
+    audio_samples, is_final = queue_item
+
+    if logger.isEnabledFor(logging.DEBUG):
+        duration_ms = len(audio_samples) / 16000 * 1000
+        # Calculate RMS to verify audio level (debug only - two passes over the chunk)
+        rms = np.sqrt(audio_samples.dot(audio_samples) / len(audio_samples))
+        max_amp = np.abs(audio_samples).max()
+        logger.debug("[WORKER] Processing chunk #%d: %d samples (%.0fms), RMS=%.4f, max=%.4f, is_final=%s",
+                     chunk_count, len(audio_samples), duration_ms, rms, max_amp, is_final)
+
+    if _stream_chunk_fn is None:
+        logger.warning("Streaming chunk received but no model loaded")
+        return
+
+    # Process chunk through model's streaming API
+    text = _stream_chunk_fn(audio_samples, is_final=is_final)
+
+    # Update accumulated text (streaming returns cumulative text)
+    # Chunks that decode no new tokens return the same string - nothing to publish.
+    # Publishing is a reference swap (str is immutable), so changed text costs O(1) here.
+    if text and (not state.transcribed_chunks or text != state.transcribed_chunks[-1]):
+        # For streaming, the model returns cumulative text, not deltas
+        # So we replace rather than append
+        if state.transcribed_chunks:
+            state.transcribed_chunks[-1] = text
+        else:
+            state.transcribed_chunks.append(text)
+
+        # Update UI if available
+        if _ui_state is not None:
+            _ui_state.accumulated_text = text
+            state.ui_update_event.set()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            if len(text) > 50:
+                logger.debug("[WORKER] Chunk #%d result: \"%s...\"", chunk_count, text[:50])
+            else:
+                logger.debug("[WORKER] Chunk #%d result: \"%s\"", chunk_count, text)
+
+    logger.debug("[WORKER] Chunk #%d done", chunk_count)
 
 
 def on_streaming_chunk(audio_samples, is_final=False):
@@ -103,17 +157,31 @@ def on_streaming_chunk(audio_samples, is_final=False):
         audio_samples: numpy array of float32 audio samples (16kHz mono)
         is_final: if True, this is the last chunk and decoder should flush
     """
-    global _streaming_queue
+    global _streaming_queue, _chunk_available, _silent_chunk_run
 
     if _streaming_queue is not None:
-        try:
-            qsize = _streaming_queue.qsize()
-            duration_ms = len(audio_samples) / 16000 * 1000
-            logger.debug(f"[QUEUE_ADD] Queueing chunk: {len(audio_samples)} samples ({duration_ms:.0f}ms), is_final={is_final}, queue size: {qsize}")
-            # Queue as tuple (audio, is_final)
-            _streaming_queue.put_nowait((audio_samples, is_final))
-        except queue.Full:
+        # Skip inference on silence; the final chunk always goes through to flush the decoder
+        if _silence_gate_threshold is not None and not is_final and len(audio_samples):
+            peak = max(audio_samples.max(), -audio_samples.min())
+            if peak < _silence_gate_threshold:
+                _silent_chunk_run += 1
+                if _silent_chunk_run > _SILENCE_FLUSH_CHUNKS:
+                    logger.debug("[QUEUE_ADD] Skipping silent chunk (peak=%.5f)", peak)
+                    return
+            else:
+                _silent_chunk_run = 0
+
+        qsize = len(_streaming_queue)
+        if qsize >= _STREAMING_QUEUE_MAX:
             logger.warning("Streaming queue full, dropping chunk")
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            duration_ms = len(audio_samples) / 16000 * 1000
+            logger.debug("[QUEUE_ADD] Queueing chunk: %d samples (%.0fms), is_final=%s, queue size: %d",
+                         len(audio_samples), duration_ms, is_final, qsize)
+        # Queue as tuple (audio, is_final)
+        _streaming_queue.append((audio_samples, is_final))
+        _chunk_available.set()
     else:
         logger.warning("Streaming chunk received but queue not initialized")
 
@@ -124,7 +192,8 @@ def start_streaming():
     Initializes the model's streaming state, starts the worker thread,
     and begins audio collection in streaming mode.
     """
-    global _streaming_queue, _streaming_worker_thread, _streaming_stop_event
+    global _streaming_queue, _chunk_available, _streaming_worker_thread
+    global _silence_gate_threshold, _silent_chunk_run, _stream_chunk_fn, _ui_state
 
     logger.info("Starting streaming recording session...")
 
@@ -133,21 +202,27 @@ def start_streaming():
 
     # Get chunk size from model (if available)
     # 1120ms (14 frames) gives best accuracy, 560ms is faster but lower quality
-    chunk_size_ms = 1120  # Default to best accuracy
-    if hasattr(state.stt_model, 'chunk_size_ms'):
-        chunk_size_ms = state.stt_model.chunk_size_ms
+    chunk_size_ms = getattr(state.stt_model, 'chunk_size_ms', 1120)  # Default to best accuracy
+
+    _stream_chunk_fn = state.stt_model.stream_chunk
+    _ui_state = getattr(state, 'app_state_ref', None)
+
+    # Silence gate: models opt in via silence_gate_threshold
+    _silence_gate_threshold = getattr(state.stt_model, 'silence_gate_threshold', None)
+    _silent_chunk_run = 0
 
     # Initialize transcription storage with empty string for streaming
     state.transcribed_chunks.clear()
     state.transcribed_chunks.append("")  # Placeholder for cumulative text
 
     # Reset accumulated text for UI
-    if hasattr(state, 'app_state_ref') and state.app_state_ref:
-        state.app_state_ref.accumulated_text = ""
+    if _ui_state is not None:
+        _ui_state.accumulated_text = ""
+        state.ui_update_event.set()
 
     # Initialize streaming queue and worker thread
-    _streaming_queue = queue.Queue(maxsize=50)  # Buffer up to 50 chunks
-    _streaming_stop_event = threading.Event()
+    _streaming_queue = deque()  # Bounded to _STREAMING_QUEUE_MAX by on_streaming_chunk
+    _chunk_available = threading.Event()
     _streaming_worker_thread = threading.Thread(
         target=_streaming_worker,
         name="StreamingWorker",
@@ -171,7 +246,7 @@ def stop_streaming():
     Returns:
         Final transcribed text from the streaming session.
     """
-    global _streaming_queue, _streaming_worker_thread, _streaming_stop_event
+    global _streaming_queue, _chunk_available, _streaming_worker_thread, _stream_chunk_fn, _ui_state
 
     logger.info("[STOP] Stopping streaming recording session...")
 
@@ -181,47 +256,34 @@ def stop_streaming():
     logger.debug("[STOP] audio_manager.stop_streaming() completed")
 
     # Wait for all queued chunks to be processed BEFORE stopping worker
-    # This fixes the race condition where final chunk wasn't transcribed
-    if _streaming_queue:
-        qsize = _streaming_queue.qsize()
-        logger.info(f"[STOP] Waiting for queue to drain ({qsize} items remaining)...")
-        try:
-            _streaming_queue.join()
-            logger.info("[STOP] Queue drained successfully - all chunks processed")
-        except Exception as e:
-            logger.warning(f"[STOP] Error waiting for queue: {e}")
-
-    # Now stop the streaming worker thread
-    if _streaming_stop_event:
-        _streaming_stop_event.set()
-
-    # Send sentinel to wake up worker if waiting
-    if _streaming_queue:
-        try:
-            _streaming_queue.put_nowait(None)
-        except queue.Full:
-            pass
-
-    # Wait for worker thread to finish
+    # This fixes the race condition where final chunk wasn't transcribed.
+    # The sentinel is the only stop signal: it is queued behind any pending
+    # chunks, so once the worker exits every chunk ahead of it has been processed.
+    if _streaming_queue is not None:
+        logger.info("[STOP] Waiting for queue to drain (%d items remaining)...", len(_streaming_queue))
+        _streaming_queue.append(None)
+        _chunk_available.set()
+
     if _streaming_worker_thread and _streaming_worker_thread.is_alive():
-        logger.debug("Waiting for streaming worker thread to finish...")
-        _streaming_worker_thread.join(timeout=2.0)
-        if _streaming_worker_thread.is_alive():
-            logger.warning("Streaming worker thread did not stop in time")
+        _streaming_worker_thread.join()
+        logger.info("[STOP] Queue drained successfully - all chunks processed")
 
     # Finalize model's streaming state and get final text
     logger.debug("[STOP] Calling model.finalize_streaming()...")
     final_text = state.stt_model.finalize_streaming()
 
     if final_text:
-        logger.info(f"[STOP] Final text ({len(final_text)} chars): \"{final_text[:80]}{'...' if len(final_text) > 80 else ''}\"")
+        logger.info("[STOP] Final text (%d chars): \"%s%s\"",
+                    len(final_text), final_text[:80], '...' if len(final_text) > 80 else '')
     else:
         logger.warning("[STOP] finalize_streaming returned empty text")
 
     # Cleanup
+    _stream_chunk_fn = None
+    _ui_state = None
     _streaming_queue = None
+    _chunk_available = None
     _streaming_worker_thread = None
-    _streaming_stop_event = None
 
     return final_text
 
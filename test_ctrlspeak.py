@@ -7,6 +7,7 @@ import sys
 import os
 import time
 import logging
+from contextlib import nullcontext
 from models.factory import ModelFactory
 from cli import parse_args_only
 from rich.console import Console
@@ -25,6 +26,13 @@ logger = logging.getLogger("ctrlspeak-test")
 console = Console()
 
 
+def _status(message):
+    """Spinner while a step runs, skipped when output isn't a terminal (e.g. benchmark logs)."""
+    if console.is_terminal:
+        return console.status(message, spinner="dots")
+    return nullcontext()
+
+
 def main():
     """Main entry point"""
     args = parse_args_only()
@@ -62,17 +70,18 @@ def main():
     console.print(f"Selected model (alias): [cyan]{args.model}[/cyan] -> Resolved: [cyan]{resolved_model_type}[/cyan]")
 
     # Load model
-    with console.status(f"[bold green]Loading {resolved_model_type} model...", spinner="dots") as status:
-        start_time = time.time()
+    # perf_counter: monotonic and high resolution, unlike time.time()
+    with _status(f"[bold green]Loading {resolved_model_type} model..."):
+        start_time = time.perf_counter()
         model = ModelFactory.get_model(model_type=resolved_model_type, device=device, verbose=args.debug)
         model.load_model()
-        load_time = time.time() - start_time
+        load_time = time.perf_counter() - start_time
 
     # Transcribe audio
-    with console.status(f"[bold green]Transcribing {args.file}...", spinner="dots") as status:
-        start_time = time.time()
+    with _status(f"[bold green]Transcribing {args.file}..."):
+        start_time = time.perf_counter()
         result = model.transcribe_batch([args.file])
-        end_time = time.time()
+        end_time = time.perf_counter()
     transcribe_time = end_time - start_time
 
     # Print results
@@ -3,42 +3,10 @@
 import sys
 import os
 
-# Apply the same patch as ctrlspeak.py
-import builtins
-_original_import = builtins.__import__
-
-def _patched_import(name, *args, **kwargs):
-    """Intercept tqdm imports and replace with no-op version."""
-    module = _original_import(name, *args, **kwargs)
-
-    if name == 'tqdm' or name.startswith('tqdm.'):
-        class NoOpTqdm:
-            def __init__(self, iterable=None, *args, **kwargs):
-                self.iterable = iterable if iterable is not None else []
-            def __iter__(self):
-                return iter(self.iterable)
-            def __enter__(self):
-                return self
-            def __exit__(self, *args):
-                pass
-            def update(self, n=1):
-                pass
-            def close(self):
-                pass
-            def set_description(self, desc=None, refresh=True):
-                pass
-            @staticmethod
-            def write(s, **kwargs):
-                pass
-
-        if hasattr(module, 'tqdm'):
-            module.tqdm = NoOpTqdm
-        if hasattr(module, 'std') and hasattr(module.std, 'tqdm'):
-            module.std.tqdm = NoOpTqdm
-
-    return module
-
-builtins.__import__ = _patched_import
+# Apply the same patch as ctrlspeak.py: a one-shot thread lock on tqdm, set
+# before anything else imports it (no import hook, so later imports cost nothing extra)
+from utils.tqdm_lock import ensure_tqdm_thread_lock
+ensure_tqdm_thread_lock()
 
 # Now test transcription
 import threading
@@ -47,8 +15,7 @@ from models.factory import ModelFactory
 
 def test_transcription():
     print("Loading model...")
-    model = ModelFactory.get_model("nvidia/parakeet-tdt-0.6b-v3", verbose=False)
-    model.load_model()
+    model = ModelFactory.get_loaded_model("nvidia/parakeet-tdt-0.6b-v3", verbose=False)
     print("✓ Model loaded successfully")
 
     # Test transcription in a thread (simulating the worker)
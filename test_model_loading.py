@@ -81,5 +81,22 @@ def test_get_model_raises_on_import_error():
         assert "nemo-toolkit" in str(exc_info.value).lower()
 
 
+def test_get_loaded_model_reuses_instance():
+    """Test that get_loaded_model() loads a model once and then reuses it."""
+    from models.factory import ModelFactory
+
+    ModelFactory.clear_model_cache()
+    with patch('models.factory.ModelFactory.get_model', side_effect=lambda **kwargs: Mock()) as mock_get:
+        first = ModelFactory.get_loaded_model("nvidia/parakeet-tdt-0.6b-v3")
+        second = ModelFactory.get_loaded_model("nvidia/parakeet-tdt-0.6b-v3")
+        other = ModelFactory.get_loaded_model("nvidia/parakeet-tdt-0.6b-v3", verbose=True)
+
+    assert first is second
+    assert other is not first
+    assert mock_get.call_count == 2
+    first.load_model.assert_called_once()
+    ModelFactory.clear_model_cache()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
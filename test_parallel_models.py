@@ -9,16 +9,18 @@ Usage:
     python test_parallel_models.py
 
 Press Enter to start recording, Enter again to stop.
+
+Each model runs in its own process so neither one's Python-side decoding
+holds the other back on the GIL. The audio callback writes into a shared
+memory ring buffer; each process keeps its own read position into it.
 """
 
-import sys
-import threading
-import queue
 import time
+import queue
+import multiprocessing as mp
+from multiprocessing import shared_memory
 import numpy as np
 import sounddevice as sd
-import tempfile
-import soundfile as sf
 
 SAMPLE_RATE = 16000
 CHUNK_SIZE_MS = 1120  # Nemotron streaming chunk size
@@ -26,165 +28,229 @@ CHUNK_SIZE_SAMPLES = int(SAMPLE_RATE * CHUNK_SIZE_MS / 1000)
 
 # RMS detection settings (same as main app)
 RMS_THRESHOLD = 0.01
+_RMS_THRESHOLD_SQ = RMS_THRESHOLD ** 2  # Compare mean-square energy, no sqrt per block
+RMS_BLOCK_SAMPLES = 512  # Granularity of the speech/silence decision (~32ms)
 SILENCE_DURATION_S = 1.0
 MIN_CHUNK_DURATION_S = 0.5
+MAX_SEGMENT_S = 60  # Force a Parakeet segment once this much speech is buffered
 
-# Shared state
-nemotron_queue = queue.Queue()  # For Nemotron streaming
-parakeet_queue = queue.Queue()  # For Parakeet batch chunks
-is_recording = False
-stop_event = threading.Event()
-
-# RMS-based chunking state for Parakeet
-rms_audio_buffer = []
-rms_silence_s = 0.0
-rms_is_speaking = False
+# Shared audio ring buffer: 60s of float32 samples. write_pos counts samples
+# written since recording started and only ever grows; readers index modulo size.
+RING_SAMPLES = SAMPLE_RATE * 60
+POLL_INTERVAL_S = 0.02  # How long a model process sleeps when no new audio has arrived
+MODEL_LOAD_TIMEOUT_S = 600  # Give up if a model process hasn't reported ready by then
 
-
-def load_models():
-    """Load both models."""
-    print("Loading models...")
-
-    # Load Nemotron
-    print("  Loading Nemotron (streaming)...")
+# Parent-process state (set up in main, used by the audio callback)
+is_recording = False
+audio_ring = None
+audio_write_pos = None
+
+
+def attach_ring(shm_name):
+    """Open the shared audio ring in a worker process.
+
+    Returns:
+        (shm, ring) - keep shm alive as long as the ring view is used.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = np.ndarray((RING_SAMPLES,), dtype=np.float32, buffer=shm.buf)
+    return shm, ring
+
+
+def ring_views(ring, start_pos, end_pos):
+    """Return views covering ring samples [start_pos, end_pos) - two if it wraps."""
+    start = start_pos % RING_SAMPLES
+    count = end_pos - start_pos
+    if start + count <= RING_SAMPLES:
+        return [ring[start:start + count]]
+    return [ring[start:], ring[:start + count - RING_SAMPLES]]
+
+
+def wait_for_audio(write_pos, read_pos, min_samples, stop_event, name):
+    """Block until at least min_samples of new audio are available.
+
+    Once recording has stopped, whatever is left (possibly less than
+    min_samples) is returned before signalling the end.
+
+    Returns:
+        (read_pos, end_pos) to consume, or None once stopped and fully drained.
+    """
+    while True:
+        # Check stop before reading write_pos so audio written before stop is never missed
+        stopped = stop_event.is_set()
+        end_pos = write_pos.value
+        if end_pos - read_pos > RING_SAMPLES:
+            print(f"\n  [{name}] fell behind by more than {RING_SAMPLES // SAMPLE_RATE}s, skipping audio",
+                  flush=True)
+            read_pos = end_pos - RING_SAMPLES
+        if end_pos - read_pos >= min_samples or (stopped and end_pos > read_pos):
+            return read_pos, end_pos
+        if stopped:
+            return None
+        time.sleep(POLL_INTERVAL_S)
+
+
+def nemotron_proc(shm_name, write_pos, stop_event, results):
+    """Nemotron streaming process."""
     from models.nemotron import NemotronModel
-    nemotron = NemotronModel()
-    nemotron.load_model()
-
-    # Load Parakeet MLX
-    print("  Loading Parakeet MLX (batch with RMS)...")
-    from models.parakeet_mlx import ParakeetMLXModel
-    parakeet = ParakeetMLXModel()
-    parakeet.load_model()
-
-    print("Both models loaded!\n")
-    return nemotron, parakeet
-
-
-def audio_callback(indata, frames, time_info, status):
-    """Audio callback - feeds both pipelines."""
-    global rms_audio_buffer, rms_silence_s, rms_is_speaking
-
-    if not is_recording:
-        return
-
-    chunk = indata.copy().flatten()
-    chunk_duration_s = float(frames) / SAMPLE_RATE
-
-    # === NEMOTRON: Fixed-interval streaming ===
-    nemotron_queue.put(chunk)
-
-    # === PARAKEET: RMS-based silence detection ===
-    rms = np.sqrt(np.mean(chunk**2))
-    is_speech = rms >= RMS_THRESHOLD
-
-    if is_speech:
-        rms_audio_buffer.append(chunk)
-        rms_silence_s = 0.0
-        rms_is_speaking = True
-    elif rms_is_speaking:
-        rms_silence_s += chunk_duration_s
-
-        if rms_silence_s >= SILENCE_DURATION_S:
-            # Silence threshold reached - queue segment for Parakeet
-            if rms_audio_buffer:
-                segment = np.concatenate(rms_audio_buffer)
-                segment_duration = len(segment) / SAMPLE_RATE
-                if segment_duration >= MIN_CHUNK_DURATION_S:
-                    parakeet_queue.put(segment)
-            rms_audio_buffer = []
-            rms_silence_s = 0.0
-            rms_is_speaking = False
-        else:
-            rms_audio_buffer.append(chunk)
-
-
-def nemotron_worker(model, results):
-    """Worker thread for Nemotron streaming."""
-    accumulated_samples = []
+    model = NemotronModel()
+    model.load_model()
+    # Warm up now so first-chunk latency after ENTER isn't inflated by lazy init
+    model.init_streaming()
+    model.stream_chunk(np.zeros(CHUNK_SIZE_SAMPLES, dtype=np.float32))
+    model.finalize_streaming()
+    results.put(('ready', 'nemotron'))
+
+    shm, ring = attach_ring(shm_name)
+    model.init_streaming()
+
+    # One model chunk of staging space: audio is copied in once from the ring
+    # and handed to the model as a view when full
+    chunk_buffer = np.empty(CHUNK_SIZE_SAMPLES, dtype=np.float32)
+    fill = 0
     chunk_count = 0
-
-    while not stop_event.is_set() or not nemotron_queue.empty():
-        try:
-            chunk = nemotron_queue.get(timeout=0.1)
-            accumulated_samples.append(chunk)
-
-            # Process when we have enough samples
-            total_samples = sum(len(c) for c in accumulated_samples)
-            if total_samples >= CHUNK_SIZE_SAMPLES:
-                audio_data = np.concatenate(accumulated_samples).flatten()
-                chunk_to_process = audio_data[:CHUNK_SIZE_SAMPLES]
-                remainder = audio_data[CHUNK_SIZE_SAMPLES:]
-
-                if len(remainder) > 0:
-                    accumulated_samples = [remainder]
-                else:
-                    accumulated_samples = []
-
-                chunk_count += 1
-                text = model.stream_chunk(chunk_to_process)
-                if text:
-                    results['nemotron'] = text
-                    # Live render Nemotron output with chunk count and text length
-                    display = text[-70:] if len(text) > 70 else text  # Show END of text
-                    print(f"\n  [N#{chunk_count} len={len(text)}] ...{display}", end='', flush=True)
-
-            nemotron_queue.task_done()
-        except queue.Empty:
-            continue
+    read_pos = 0
+
+    while True:
+        span = wait_for_audio(write_pos, read_pos, 1, stop_event, "N")
+        if span is None:
+            break
+        read_pos, end_pos = span
+
+        # Feed full chunks back-to-back; after a slow step this catches up in one pass
+        text = None
+        for view in ring_views(ring, read_pos, end_pos):
+            offset = 0
+            while offset < len(view):
+                n = min(len(view) - offset, CHUNK_SIZE_SAMPLES - fill)
+                chunk_buffer[fill:fill + n] = view[offset:offset + n]
+                fill += n
+                offset += n
+                if fill == CHUNK_SIZE_SAMPLES:
+                    chunk_count += 1
+                    # stream_chunk is synchronous, so reusing the buffer afterwards is safe
+                    text = model.stream_chunk(chunk_buffer) or text
+                    fill = 0
+        read_pos = end_pos
+
+        if text:
+            # Live render Nemotron output with chunk count and text length
+            display = text[-70:] if len(text) > 70 else text  # Show END of text
+            print(f"\n  [N#{chunk_count} len={len(text)}] ...{display}", end='', flush=True)
 
     # Process any remaining audio with is_final=True
-    if accumulated_samples:
-        remaining = np.concatenate(accumulated_samples).flatten()
-        if len(remaining) > 0:
-            chunk_count += 1
-            text = model.stream_chunk(remaining, is_final=True)
-            if text:
-                results['nemotron'] = text
+    if fill > 0:
+        chunk_count += 1
+        model.stream_chunk(chunk_buffer[:fill], is_final=True)
 
     # Finalize
     final_text = model.finalize_streaming()
-    results['nemotron'] = final_text
-    results['nemotron_chunks'] = chunk_count
+    results.put(('nemotron', final_text, chunk_count))
+
+    del ring
+    shm.close()
 
 
-def parakeet_worker(model, results):
-    """Worker thread for Parakeet with RMS-based real-time chunking."""
+def parakeet_proc(shm_name, write_pos, stop_event, results):
+    """Parakeet process with RMS-based real-time chunking."""
+    from models.parakeet_mlx import ParakeetMLXModel
+    model = ParakeetMLXModel()
+    model.load_model()
+    model.transcribe_array(np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE)
+    results.put(('ready', 'parakeet'))
+
+    shm, ring = attach_ring(shm_name)
+
+    # Pre-allocated speech buffer; segment_fill is the write index
+    segment_buffer = np.empty(SAMPLE_RATE * MAX_SEGMENT_S, dtype=np.float32)
+    segment_fill = 0
+    silence_s = 0.0
+    is_speaking = False
     transcriptions = []
     segment_count = 0
+    read_pos = 0
 
-    while not stop_event.is_set() or not parakeet_queue.empty():
-        try:
-            segment = parakeet_queue.get(timeout=0.1)
+    def flush_segment():
+        """Transcribe the buffered speech (if long enough) and reset the buffer."""
+        nonlocal segment_fill, segment_count
+        if segment_fill / SAMPLE_RATE >= MIN_CHUNK_DURATION_S:
             segment_count += 1
-
-            # Save to temp file and transcribe
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-                sf.write(f.name, segment, SAMPLE_RATE)
-                temp_path = f.name
-
-            result = model.transcribe_batch([temp_path])
-            if result and result[0]:
-                transcriptions.append(result[0])
+            # Transcribe straight from memory - no temp WAV encode/decode
+            text = model.transcribe_array(segment_buffer[:segment_fill], SAMPLE_RATE)
+            if text:
+                transcriptions.append(text)
                 # Show running transcription
                 current_text = " ".join(transcriptions)
                 display = current_text[:70] + "..." if len(current_text) > 70 else current_text
                 print(f"\n  [P] {display}", end='', flush=True)
+        segment_fill = 0
+
+    def buffer_block(block):
+        """Append a block to the speech buffer, flushing it when full."""
+        nonlocal segment_fill
+        if segment_fill + len(block) > len(segment_buffer):
+            flush_segment()
+        segment_buffer[segment_fill:segment_fill + len(block)] = block
+        segment_fill += len(block)
+
+    while True:
+        span = wait_for_audio(write_pos, read_pos, RMS_BLOCK_SAMPLES, stop_event, "P")
+        if span is None:
+            break
+        read_pos, end_pos = span
+
+        for pos in range(read_pos, end_pos, RMS_BLOCK_SAMPLES):
+            views = ring_views(ring, pos, min(pos + RMS_BLOCK_SAMPLES, end_pos))
+            block = views[0] if len(views) == 1 else np.concatenate(views)
+            if len(block) < RMS_BLOCK_SAMPLES and not stop_event.is_set():
+                # Partial tail - decide on it once the rest of the block arrives
+                end_pos = pos
+                break
+
+            # rms >= T  <=>  sum(x^2) >= T^2 * N: one dot product, no temporary, no sqrt
+            is_speech = block.dot(block) >= _RMS_THRESHOLD_SQ * len(block)
+
+            if is_speech:
+                buffer_block(block)
+                silence_s = 0.0
+                is_speaking = True
+            elif is_speaking:
+                silence_s += len(block) / SAMPLE_RATE
+
+                if silence_s >= SILENCE_DURATION_S:
+                    # Silence threshold reached - transcribe segment
+                    flush_segment()
+                    silence_s = 0.0
+                    is_speaking = False
+                else:
+                    buffer_block(block)
+        read_pos = end_pos
+
+    # Transcribe any remaining audio
+    flush_segment()
+    results.put(('parakeet', " ".join(transcriptions), segment_count))
 
-            # Cleanup
-            import os
-            os.unlink(temp_path)
+    del ring
+    shm.close()
 
-            parakeet_queue.task_done()
-        except queue.Empty:
-            continue
 
-    results['parakeet'] = " ".join(transcriptions)
-    results['parakeet_segments'] = segment_count
+def audio_callback(indata, frames, time_info, status):
+    """Audio callback - publishes samples to the shared ring for both processes."""
+    if not is_recording:
+        return
+
+    pos = audio_write_pos.value
+    start = pos % RING_SAMPLES
+    n = min(frames, RING_SAMPLES - start)
+    audio_ring[start:start + n] = indata[:n, 0]
+    if n < frames:
+        audio_ring[:frames - n] = indata[n:, 0]
+    # Publish only after the samples are in place
+    audio_write_pos.value = pos + frames
 
 
 def main():
-    global is_recording, rms_audio_buffer, rms_silence_s, rms_is_speaking
+    global is_recording, audio_ring, audio_write_pos
 
     print("=" * 60)
     print("PARALLEL MODEL COMPARISON TEST (Both Real-Time)")
@@ -194,67 +260,102 @@ def main():
     print("Parakeet: RMS-based silence detection (batch per segment)")
     print()
 
-    # Load models
-    nemotron, parakeet = load_models()
-
-    # Results storage
-    results = {
-        'nemotron': '',
-        'parakeet': '',
-        'nemotron_chunks': 0,
-        'parakeet_segments': 0
-    }
-
-    input("Press ENTER to start recording...")
-    print("\nRecording... (press ENTER to stop)\n")
-
-    # Initialize Nemotron streaming
-    nemotron.init_streaming()
-
-    # Reset state
-    rms_audio_buffer = []
-    rms_silence_s = 0.0
-    rms_is_speaking = False
-    stop_event.clear()
-    is_recording = True
-
-    # Start workers
-    nemotron_thread = threading.Thread(target=nemotron_worker, args=(nemotron, results))
-    parakeet_thread = threading.Thread(target=parakeet_worker, args=(parakeet, results))
-    nemotron_thread.start()
-    parakeet_thread.start()
-
-    # Start audio stream
-    stream = sd.InputStream(
-        samplerate=SAMPLE_RATE,
-        channels=1,
-        callback=audio_callback,
-        dtype=np.float32
-    )
-    stream.start()
-
-    # Wait for user to stop
-    input()
-
-    # Stop recording
-    print("\n\nStopping...")
-    is_recording = False
-
-    # Queue any remaining audio for Parakeet
-    if rms_audio_buffer:
-        segment = np.concatenate(rms_audio_buffer)
-        if len(segment) / SAMPLE_RATE >= MIN_CHUNK_DURATION_S:
-            parakeet_queue.put(segment)
-
-    stop_event.set()
-    stream.stop()
-    stream.close()
-
-    # Wait for workers
-    print("  Waiting for Nemotron...")
-    nemotron_thread.join(timeout=10)
-    print("  Waiting for Parakeet...")
-    parakeet_thread.join(timeout=30)
+    # torch/MLX are not fork-safe, so always start clean interpreters
+    ctx = mp.get_context("spawn")
+
+    shm = shared_memory.SharedMemory(create=True, size=RING_SAMPLES * np.dtype(np.float32).itemsize)
+    audio_ring = np.ndarray((RING_SAMPLES,), dtype=np.float32, buffer=shm.buf)
+    audio_write_pos = ctx.Value('q', 0, lock=False)  # Single writer: the audio callback
+    stop_event = ctx.Event()
+    result_queue = ctx.Queue()
+
+    # Load models (each process loads and warms up its own)
+    print("Loading models...")
+    procs = [
+        ctx.Process(target=nemotron_proc, args=(shm.name, audio_write_pos, stop_event, result_queue),
+                    name="nemotron"),
+        ctx.Process(target=parakeet_proc, args=(shm.name, audio_write_pos, stop_event, result_queue),
+                    name="parakeet"),
+    ]
+    stream = None
+    try:
+        for proc in procs:
+            proc.start()
+        deadline = time.monotonic() + MODEL_LOAD_TIMEOUT_S
+        loaded = 0
+        while loaded < len(procs):
+            try:
+                _, name = result_queue.get(timeout=1.0)
+            except queue.Empty:
+                dead = [proc.name for proc in procs if not proc.is_alive()]
+                if dead:
+                    print(f"Model process exited while loading: {', '.join(dead)}")
+                    return
+                if time.monotonic() > deadline:
+                    print(f"Models not loaded after {MODEL_LOAD_TIMEOUT_S}s, giving up")
+                    return
+                continue
+            loaded += 1
+            print(f"  {name} loaded")
+        print("Both models loaded!\n")
+
+        # Results storage
+        results = {
+            'nemotron': '',
+            'parakeet': '',
+            'nemotron_chunks': 0,
+            'parakeet_segments': 0
+        }
+
+        input("Press ENTER to start recording...")
+        print("\nRecording... (press ENTER to stop)\n")
+
+        is_recording = True
+
+        # Start audio stream
+        stream = sd.InputStream(
+            samplerate=SAMPLE_RATE,
+            channels=1,
+            callback=audio_callback,
+            dtype=np.float32
+        )
+        stream.start()
+
+        # Wait for user to stop
+        input()
+
+        # Stop recording
+        print("\n\nStopping...")
+        is_recording = False
+        stream.stop()
+        stream.close()
+        stream = None
+        stop_event.set()
+
+        # Wait for workers
+        print("  Waiting for results...")
+        for _ in procs:
+            try:
+                name, text, count = result_queue.get(timeout=60)
+            except queue.Empty:
+                print("  Timed out waiting for results")
+                break
+            results[name] = text
+            results['nemotron_chunks' if name == 'nemotron' else 'parakeet_segments'] = count
+        for proc in procs:
+            proc.join(timeout=10)
+    finally:
+        is_recording = False
+        if stream is not None:
+            stream.close()
+        stop_event.set()
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=5)
+        audio_ring = None  # Drop the view into shm.buf so the segment can close
+        shm.close()
+        shm.unlink()
 
     # Print results
     print("\n" + "=" * 60)
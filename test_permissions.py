@@ -8,19 +8,22 @@ permission issues during development or helping users troubleshoot.
 """
 
 import sys
-import os
-import time
-import platform
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress
 
 # Import our permission manager functions
 from utils import permission_manager
 
+# Display names for sys.platform; avoids platform.system()'s uname/subprocess lookup
+_OS_NAMES = {"darwin": "macOS", "linux": "Linux", "win32": "Windows"}
+
 class PermissionTester:
     def __init__(self):
         self.console = Console()
+        # Resolved once: both the banner and the troubleshooting tips show it
+        self._parent_app = permission_manager.detect_parent_app()
+        # Permission results from the last run_all_tests, reused by display_summary
+        self._status = None
         
     def run_all_tests(self):
         """Run all permission tests"""
@@ -33,15 +36,16 @@ class PermissionTester:
         ))
         
         self.console.print("\n[bold]System Information:[/bold]")
-        self.console.print(f"OS: {platform.system()} {platform.release()}")
+        self.console.print(f"OS: {_OS_NAMES.get(sys.platform, sys.platform)}")
         self.console.print(f"Python: {sys.version.split()[0]}")
         self.console.print(f"Running from: {sys.executable}")
-        self.console.print(f"Parent Application: [bold]{permission_manager.detect_parent_app()}[/bold]")
+        self.console.print(f"Parent Application: [bold]{self._parent_app}[/bold]")
         self.console.print(f"Script location: {__file__}")
         
         # Check all permissions using our manager
         self.console.print("\n[bold cyan]Testing All Permissions[/bold cyan]")
         all_permissions_ok = permission_manager.check_all_permissions(verbose=True, console=self.console)
+        self._status = permission_manager.get_permissions_status()
         
         # Display summary
         self.display_summary()
@@ -62,10 +66,13 @@ class PermissionTester:
 
     def display_summary(self):
         """Display a summary of all test results"""
-        self.console.print("\n[bold]Test Results Summary:[/bold]")
+        # Collected and printed in one go: one console lock/flush instead of one per line
+        lines = ["\n[bold]Test Results Summary:[/bold]"]
         
-        # Get permission states
-        permissions_status = permission_manager.get_permissions_status()
+        # Get permission states (as recorded by run_all_tests, if it ran)
+        if self._status is None:
+            self._status = permission_manager.get_permissions_status()
+        permissions_status = self._status
         
         keyboard_granted = permissions_status["keyboard"]["granted"]
         keyboard_working = permissions_status["keyboard"]["working"]
@@ -78,28 +85,28 @@ class PermissionTester:
             microphone_granted and microphone_working
         ) else "[red]FAILED[/red]"
         
-        self.console.print(f"Microphone: {mic_status}")
-        self.console.print(f"  - Permission Granted: {'[green]Yes[/green]' if microphone_granted else '[red]No[/red]'}")
-        self.console.print(f"  - Functionality Working: {'[green]Yes[/green]' if microphone_working else '[red]No[/red]'}")
+        lines.append(f"Microphone: {mic_status}")
+        lines.append(f"  - Permission Granted: {'[green]Yes[/green]' if microphone_granted else '[red]No[/red]'}")
+        lines.append(f"  - Functionality Working: {'[green]Yes[/green]' if microphone_working else '[red]No[/red]'}")
         
         if permissions_status["microphone"]["errors"]:
-            self.console.print("  - Errors:")
+            lines.append("  - Errors:")
             for error in permissions_status["microphone"]["errors"]:
-                self.console.print(f"    - {error}")
+                lines.append(f"    - {error}")
         
         # Keyboard summary
         kb_status = "[green]PASSED[/green]" if (
             keyboard_granted and keyboard_working
         ) else "[red]FAILED[/red]"
         
-        self.console.print(f"\nKeyboard Monitoring: {kb_status}")
-        self.console.print(f"  - Permission Granted: {'[green]Yes[/green]' if keyboard_granted else '[red]No[/red]'}")
-        self.console.print(f"  - Functionality Working: {'[green]Yes[/green]' if keyboard_working else '[red]No[/red]'}")
+        lines.append(f"\nKeyboard Monitoring: {kb_status}")
+        lines.append(f"  - Permission Granted: {'[green]Yes[/green]' if keyboard_granted else '[red]No[/red]'}")
+        lines.append(f"  - Functionality Working: {'[green]Yes[/green]' if keyboard_working else '[red]No[/red]'}")
         
         if permissions_status["keyboard"]["errors"]:
-            self.console.print("  - Errors:")
+            lines.append("  - Errors:")
             for error in permissions_status["keyboard"]["errors"]:
-                self.console.print(f"    - {error}")
+                lines.append(f"    - {error}")
         
         # Overall result
         overall_result = (
@@ -107,29 +114,31 @@ class PermissionTester:
             (microphone_granted and microphone_working)
         )
         
-        self.console.print(f"\n[bold]{'[green]ALL TESTS PASSED[/green]' if overall_result else '[red]TESTS FAILED[/red]'}[/bold]")
+        lines.append(f"\n[bold]{'[green]ALL TESTS PASSED[/green]' if overall_result else '[red]TESTS FAILED[/red]'}[/bold]")
         
         if not overall_result:
-            self.console.print("\n[yellow]Troubleshooting Tips:[/yellow]")
-            parent_app = permission_manager.detect_parent_app()
+            lines.append("\n[yellow]Troubleshooting Tips:[/yellow]")
+            parent_app = self._parent_app
             
             if not keyboard_granted:
-                self.console.print(f"- Make sure [bold]{parent_app}[/bold] has accessibility permissions in System Settings")
+                lines.append(f"- Make sure [bold]{parent_app}[/bold] has accessibility permissions in System Settings")
                 
                 if sys.platform == "darwin":  # macOS specific
-                    self.console.print("- For accessibility permissions on macOS:")
-                    self.console.print("  1. Go to System Settings → Privacy & Security → Accessibility")
-                    self.console.print(f"  2. Make sure [bold]{parent_app}[/bold] is CHECKED (not Python or ctrlSPEAK)")
-                    self.console.print("  3. If already checked, try removing and re-adding the permission")
-                    self.console.print("  4. Log out and log back in, or restart your computer")
+                    lines.append("- For accessibility permissions on macOS:")
+                    lines.append("  1. Go to System Settings → Privacy & Security → Accessibility")
+                    lines.append(f"  2. Make sure [bold]{parent_app}[/bold] is CHECKED (not Python or ctrlSPEAK)")
+                    lines.append("  3. If already checked, try removing and re-adding the permission")
+                    lines.append("  4. Log out and log back in, or restart your computer")
             
             if not microphone_granted:
-                self.console.print("- Make sure the application has microphone permissions in System Settings")
+                lines.append("- Make sure the application has microphone permissions in System Settings")
                 
                 if sys.platform == "darwin":  # macOS specific
-                    self.console.print("- For microphone permissions on macOS:")
-                    self.console.print("  1. Go to System Settings → Privacy & Security → Microphone")
-                    self.console.print("  2. Make sure the application is in the list and CHECKED")
+                    lines.append("- For microphone permissions on macOS:")
+                    lines.append("  1. Go to System Settings → Privacy & Security → Microphone")
+                    lines.append("  2. Make sure the application is in the list and CHECKED")
+
+        self.console.print("\n".join(lines))
 
 def main():
     """Run the permission tests"""
@@ -9,6 +9,9 @@ sys.path.insert(0, os.path.dirname(__file__))
 import threading
 import importlib
 
+# Runtime type of threading.RLock() (the C _thread.RLock), built once at import
+_RLOCK_TYPE = type(threading.RLock())
+
 
 def test_entrypoint_sets_thread_lock_on_tqdm():
     # Ensure we import the entrypoint so its top-level setup runs
@@ -30,8 +33,7 @@ def test_entrypoint_sets_thread_lock_on_tqdm():
     lock_obj = T.get_lock()
     print(f"tqdm class module: {mod}")
     print(f"tqdm lock object: {lock_obj!r}")
-    rlock_type = type(threading.RLock())
-    assert isinstance(lock_obj, rlock_type)
+    assert isinstance(lock_obj, _RLOCK_TYPE)
 
     # Ensure NeMo was not imported as a side effect
     assert 'nemo.collections.asr' not in sys.modules
@@ -11,8 +11,7 @@ def worker_transcribe(model_type, audio_file, result_queue):
     """Transcribe in a worker thread (simulates transcription worker)."""
     try:
         device = torch.device('mps') if torch.backends.mps.is_available() else torch.device('cpu')
-        model = ModelFactory.get_model(model_type=model_type, device=device, verbose=False)
-        model.load_model()
+        model = ModelFactory.get_loaded_model(model_type=model_type, device=device, verbose=False)
         print(f'Worker: Model loaded')
 
         result = model.transcribe(audio_file)
@@ -4,7 +4,8 @@ Test suite for history functionality.
 """
 
 import pytest
-import time
+import sqlite3
+import threading
 from pathlib import Path
 from utils.history import HistoryManager, HistoryEntry
 
@@ -43,10 +44,64 @@ def test_add_multiple_entries(history):
     assert len(entries) == 2
 
 
+def test_add_entries_batch(history):
+    """Test adding several entries in one transaction."""
+    ids = history.add_entries([
+        {"text": "First", "model": "parakeet", "duration_seconds": 5.2},
+        {"text": "   ", "model": "parakeet"},  # Skipped
+        {"text": "Second", "model": "whisper", "duration_seconds": 8.7, "language": "de"},
+    ])
+
+    assert len(ids) == 2
+    assert ids[1] > ids[0]
+    second = history.get_by_id(ids[1])
+    assert second.text == "Second"
+    assert second.language == "de"
+    assert len(history.get_recent(limit=10)) == 2
+
+
+def test_add_entries_empty(history):
+    """Test that a batch with nothing to save is a no-op."""
+    assert history.add_entries([]) == []
+    assert history.add_entries([{"text": "", "model": "parakeet"}]) == []
+
+
+def test_wal_mode(history, temp_db):
+    """Test that the database is created in WAL journal mode."""
+    with sqlite3.connect(temp_db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_shared_connection_across_threads(history):
+    """Test entries added from another thread use the same connection."""
+    history.add_entry("Main thread", "parakeet", 1.0)
+    conn = history._conn
+
+    worker = threading.Thread(target=history.add_entry, args=("Worker thread", "parakeet", 1.0))
+    worker.start()
+    worker.join()
+
+    assert history._conn is conn
+    assert [e.text for e in history.get_recent(limit=10)] == ["Worker thread", "Main thread"]
+
+    history.close()
+    assert history.get_stats()["total_entries"] == 2
+
+
+def test_close_history_manager(history, monkeypatch):
+    """Test the global manager's connection is closed on shutdown."""
+    import utils.history
+    monkeypatch.setattr(utils.history, "_history_manager", history)
+    history.add_entry("Before shutdown", "parakeet", 1.0)
+    assert history._conn is not None
+
+    utils.history.close_history_manager()
+    assert history._conn is None
+
+
 def test_get_recent_order(history):
     """Test that get_recent returns most recent first."""
     id1 = history.add_entry("First", "parakeet", 1.0)
-    time.sleep(0.01)  # Ensure different timestamps
     id2 = history.add_entry("Second", "parakeet", 1.0)
 
     entries = history.get_recent(limit=10)
@@ -55,6 +110,37 @@ def test_get_recent_order(history):
     assert entries[1].id == id1
 
 
+def test_get_recent_order_same_timestamp(history, temp_db):
+    """Test that entries with identical timestamps come back newest ID first."""
+    with sqlite3.connect(temp_db) as conn:
+        for text in ("First", "Second"):
+            conn.execute(
+                "INSERT INTO history (timestamp, text, model) VALUES (?, ?, ?)",
+                ("2024-01-15T10:30:00", text, "parakeet")
+            )
+
+    entries = history.get_recent(limit=10)
+
+    assert [e.text for e in entries] == ["Second", "First"]
+
+
+def test_get_page(history, temp_db):
+    """Test paging continues after the last entry, including timestamp ties."""
+    history.add_entries(
+        {"text": f"Entry {i}", "model": "parakeet", "duration_seconds": 1.0}
+        for i in range(5)
+    )
+    # The two oldest entries share a timestamp, split across the page boundary
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("UPDATE history SET timestamp = '2024-01-01T00:00:00' WHERE text IN ('Entry 0', 'Entry 1')")
+
+    first = history.get_page(limit=4)
+    rest = history.get_page(limit=4, after=first[-1])
+    assert [e.text for e in first] == ["Entry 4", "Entry 3", "Entry 2", "Entry 1"]
+    assert [e.text for e in rest] == ["Entry 0"]
+    assert history.get_page(limit=4, after=rest[-1]) == []
+
+
 def test_get_by_id(history):
     """Test retrieving entry by ID."""
     entry_id = history.add_entry("Test text", "parakeet", 5.2, "en")
@@ -114,6 +200,64 @@ def test_get_stats(history):
     assert stats['total_words'] > 0
 
 
+def test_get_stats_tracks_deletes(history):
+    """Test statistics follow deletes and clear_all."""
+    id1 = history.add_entry("Hello world", "parakeet", 2.5)
+    history.add_entries([
+        {"text": "One two three", "model": "parakeet", "duration_seconds": 1.0},
+        {"text": "Four", "model": "parakeet", "duration_seconds": 0.5},
+    ])
+
+    assert history.get_stats() == {"total_entries": 3, "total_words": 6, "total_duration": 4.0}
+
+    history.delete_entry(id1)
+    assert history.get_stats() == {"total_entries": 2, "total_words": 4, "total_duration": 1.5}
+
+    history.clear_all()
+    assert history.get_stats() == {"total_entries": 0, "total_words": 0, "total_duration": 0.0}
+
+
+def test_get_stats_cached_until_write(history, temp_db):
+    """Test statistics are reused until the manager writes again."""
+    history.add_entry("Hello world", "parakeet", 2.5)
+    assert history.get_stats()["total_entries"] == 1
+
+    # Changes made behind the manager's back aren't seen until its next write
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("UPDATE history_stats SET total_entries = 10")
+    assert history.get_stats()["total_entries"] == 1
+
+    history.add_entry("Again", "parakeet", 1.0)
+    assert history.get_stats()["total_entries"] == 11
+
+
+def test_migrate_v1_stats(temp_db):
+    """Test a version 1 database gets stats seeded from its existing entries."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("CREATE TABLE schema_version (version INTEGER NOT NULL)")
+        conn.execute("INSERT INTO schema_version (version) VALUES (1)")
+        conn.execute("""
+            CREATE TABLE history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                text TEXT NOT NULL,
+                model TEXT NOT NULL,
+                duration_seconds REAL,
+                language TEXT DEFAULT 'en'
+            )
+        """)
+        conn.execute(
+            "INSERT INTO history (timestamp, text, model, duration_seconds) VALUES (?, ?, ?, ?)",
+            ("2024-01-15T10:30:00", "Old entry here", "parakeet", 3.0)
+        )
+
+    history = HistoryManager(db_path=temp_db)
+    assert history.get_stats() == {"total_entries": 1, "total_words": 3, "total_duration": 3.0}
+
+    history.add_entry("New", "parakeet", 1.0)
+    assert history.get_stats() == {"total_entries": 2, "total_words": 4, "total_duration": 4.0}
+
+
 def test_clear_all(history):
     """Test clearing all entries."""
     history.add_entry("Test 1", "parakeet", 1.0)
@@ -169,5 +313,46 @@ def test_entry_preview_long():
     assert entry.preview.endswith("...")
 
 
+def test_entry_short_preview():
+    """Test short preview is cut to 60 chars when the entry is built."""
+    entry = HistoryEntry(
+        id=1,
+        timestamp="2024-01-15T10:30:00",
+        text="c" * 80,
+        model="parakeet",
+        duration_seconds=5.0,
+        language="en"
+    )
+    assert entry.short_preview == "c" * 60 + "..."
+
+    entry = HistoryEntry(
+        id=2,
+        timestamp="2024-01-15T10:30:00",
+        text="c" * 60,
+        model="parakeet",
+        duration_seconds=5.0,
+        language="en"
+    )
+    assert entry.short_preview == "c" * 60
+
+
+def test_entry_display_text():
+    """Test display text is built from the entry and cached."""
+    entry = HistoryEntry(
+        id=1,
+        timestamp="2024-01-15T10:30:00",
+        text="[b]" + "b" * 200,
+        model="parakeet",
+        duration_seconds=5.0,
+        language="en"
+    )
+
+    text = entry.display_text
+    assert text.plain == "2024-01-15 10:30:00 | parakeet | 5.0s\n  [b]" + "b" * 57 + "..."
+    styles = {text.plain[span.start:span.end]: span.style for span in text.spans}
+    assert styles == {"2024-01-15 10:30:00": "cyan", "parakeet": "dim", "5.0s": "yellow"}
+    assert entry.display_text is text
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
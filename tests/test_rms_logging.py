@@ -5,8 +5,8 @@ Runs for 5 seconds and prints RMS values to debug log.
 """
 
 import sounddevice as sd
-import numpy as np
 import logging
+import math
 import time
 import sys
 
@@ -29,13 +29,19 @@ logger = logging.getLogger("test_rms_logging")
 def rms_log_callback(indata, frames, time_info, status):
     """Calculates and logs the RMS of the incoming audio chunk."""
     if status:
-        logger.warning(f"Callback status: {status}")
+        logger.warning("Callback status: %s", status)
     
+    # The RMS is only ever logged, so skip it entirely when DEBUG is filtered out
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     try:
         # Calculate RMS for the current chunk
-        # indata is likely float32 for sounddevice
-        rms = np.sqrt(np.mean(indata**2))
-        logger.debug(f"RMS: {rms:.6f}")
+        # indata is float32 (see dtype below); a dot product over the flat view
+        # sums the squares without allocating an indata**2 temporary
+        flat = indata.reshape(-1)
+        rms = math.sqrt(float(flat @ flat) / flat.size)
+        logger.debug("RMS: %.6f", rms)
     except Exception as e:
         logger.error(f"Error calculating RMS in callback: {e}", exc_info=True)
 
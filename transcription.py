@@ -1,13 +1,15 @@
 
 import time
 import os
+import queue
 import tempfile
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import soundfile as sf
 import state
-from utils.audio import SAMPLE_RATE
+from utils.audio import SAMPLE_RATE, compute_rms, encode_pcm16
 
 # Suppress tqdm multiprocessing warnings (they're non-fatal but noisy)
 # See TQDM_ISSUE_ANALYSIS.md for detailed explanation
@@ -15,88 +17,163 @@ warnings.filterwarnings('ignore', category=RuntimeWarning, module='tqdm')
 
 logger = logging.getLogger("ctrlspeak")
 
-def transcription_worker(model, work_queue, results_list, source_lang, target_lang):
+# Marks "no chunk prefetched" (None is the worker's stop sentinel)
+_NO_CHUNK = object()
+
+
+def _write_wav(path, audio_data):
+    """Write mono float32 audio to a 16-bit WAV.
+
+    The int16 conversion is done up front in one numpy pass (encode_pcm16), so
+    libsndfile writes the samples as-is with no conversion of its own.
     """
-    Pulls audio data from queue, transcribes using the real model (via temp file),
-    adds text to results_list. Runs in a separate thread until None is received.
+    pcm = encode_pcm16(audio_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        # Only worth another pass over the samples when it's going to be logged
+        logger.debug("Encoded %d samples for WAV (RMS=%.4f)", len(pcm), compute_rms(audio_data))
+    with sf.SoundFile(path, mode='w', samplerate=SAMPLE_RATE, channels=1, subtype='PCM_16') as f:
+        f.write(pcm)
+
+
+def console_printer(print_queue):
     """
-    logger.debug("Transcription worker thread started.")
+    Prints transcribed text handed over by transcription_worker. Runs in its own
+    thread so terminal writes never hold up transcription. Exits on None.
+    """
+    while True:
+        text = print_queue.get()
+        if text is None:
+            break
+        state.console.print(f"\n[dim]{text}[/dim]")
 
-    while True: 
-        audio_data = None
-        temp_file_path = None
-        try:
-            audio_data = work_queue.get() 
-            
-            if audio_data is None:
-                logger.info("Worker received None sentinel. Exiting loop.")
-                work_queue.task_done()
-                logger.debug("Worker thread loop terminating.")
-                break
-            
-            logger.debug(f"Worker received chunk of type {type(audio_data)} and shape {getattr(audio_data, 'shape', 'N/A')}")
 
-            if len(audio_data) == 0:
-                 logger.warning("Worker received empty audio data array, skipping.")
-                 work_queue.task_done()
-                 continue
+def transcription_worker(model, work_queue, results_list, source_lang, target_lang, print_queue=None):
+    """
+    Pulls audio data from queue, transcribes using the real model, adds text to
+    results_list. Runs in a separate thread until None is received.
+
+    If print_queue is given, each text is put there for console_printer instead
+    of being printed from this thread.
+
+    Models that provide ``transcribe_array`` get the samples directly; others
+    are handed a temp WAV file via ``transcribe_batch``.
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                temp_file_path = tmp.name
-            logger.debug(f"Worker created temp file: {temp_file_path}")
+    Queued chunks must be 1-D float32 arrays at SAMPLE_RATE - AudioManager opens
+    its input streams with dtype='float32' so no conversion is needed here.
+    """
+    logger.debug("Transcription worker thread started.")
+    in_memory = hasattr(model, 'transcribe_array')
+    # File-path models alternate between two temp WAVs that live for the whole
+    # session: while one is being transcribed, the next chunk (if already queued)
+    # is written to the other on io_pool. Both are deleted when the worker exits.
+    temp_file_paths = []
+    io_pool = None if in_memory else ThreadPoolExecutor(max_workers=1, thread_name_prefix="WavWriter")
+    next_item = _NO_CHUNK  # Chunk already taken off work_queue by the prefetch
+    next_write = None  # (future, path) of next_item's WAV write
 
+    try:
+        while True:
+            if next_item is _NO_CHUNK:
+                audio_data = work_queue.get()
+            else:
+                audio_data, next_item = next_item, _NO_CHUNK
+            pending_write, next_write = next_write, None
+            # Every get() is matched by exactly one task_done() in the finally below,
+            # whichever way the iteration ends (sentinel, skip, error or success)
             try:
-                if audio_data.dtype != np.float32:
-                    logger.warning(f"Audio data was {audio_data.dtype}, attempting conversion to float32 for sf.write")
-                    audio_data = audio_data.astype(np.float32)
+                if audio_data is None:
+                    logger.info("Worker received None sentinel. Exiting loop.")
+                    logger.debug("Worker thread loop terminating.")
+                    break
                 
-                sf.write(temp_file_path, audio_data, SAMPLE_RATE)
-                logger.debug(f"Worker successfully wrote {len(audio_data)} samples to {temp_file_path}")
-            except Exception as write_e:
-                logger.error(f"Worker failed to write temp WAV file {temp_file_path}: {write_e}", exc_info=True)
-                work_queue.task_done()
-                if temp_file_path and os.path.exists(temp_file_path):
-                     try: os.unlink(temp_file_path)
-                     except Exception: pass
-                continue
+                logger.debug("Worker received chunk of type %s and shape %s", type(audio_data), getattr(audio_data, 'shape', 'N/A'))
+
+                assert audio_data.dtype == np.float32, audio_data.dtype
+
+                if len(audio_data) == 0:
+                     logger.warning("Worker received empty audio data array, skipping.")
+                     continue
+
+                if in_memory:
+                    logger.debug("Worker calling model.transcribe_array() for %d samples...", len(audio_data))
+                    transcription_start_time = time.time()
+                    try:
+                        text = model.transcribe_array(audio_data, SAMPLE_RATE, source_lang=source_lang, target_lang=target_lang)
+                        transcription_duration = time.time() - transcription_start_time
+                        logger.info("Worker transcribed chunk in %.2fs: %.30s...", transcription_duration, text)
+                    except Exception as transcribe_e:
+                        logger.error(f"Worker: Error during model transcription: {transcribe_e}", exc_info=True)
+                        text = None
+                else:
+                    if not temp_file_paths:
+                        for _ in range(2):
+                            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+                                temp_file_paths.append(tmp.name)
+                        logger.debug("Worker created temp files: %s", temp_file_paths)
 
-            logger.debug(f"Worker calling model.transcribe() for {temp_file_path}...")
-            transcription_start_time = time.time()
+                    try:
+                        if pending_write is not None:
+                            # Written in the background while the previous chunk was transcribed
+                            write_future, temp_file_path = pending_write
+                            write_future.result()
+                        else:
+                            temp_file_path = temp_file_paths[0]
+                            _write_wav(temp_file_path, audio_data)
+                        logger.debug("Worker successfully wrote %d samples to %s", len(audio_data), temp_file_path)
+                    except Exception as write_e:
+                        logger.error(f"Worker failed to write temp WAV file: {write_e}", exc_info=True)
+                        continue
+
+                    # Start writing the next chunk, if one is waiting, while this one transcribes
+                    try:
+                        next_item = work_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    else:
+                        if isinstance(next_item, np.ndarray) and next_item.dtype == np.float32 and len(next_item):
+                            spare_path = temp_file_paths[1] if temp_file_path == temp_file_paths[0] else temp_file_paths[0]
+                            next_write = (io_pool.submit(_write_wav, spare_path, next_item), spare_path)
+
+                    logger.debug("Worker calling model.transcribe() for %s...", temp_file_path)
+                    transcription_start_time = time.time()
+                    try:
+                         results = model.transcribe_batch([temp_file_path], source_lang=source_lang, target_lang=target_lang)
+                         if results and isinstance(results, list):
+                              text = results[0]
+                         else:
+                              text = None
+                              logger.warning(f"Worker received unexpected result type from transcribe_batch: {type(results)}")
+                         transcription_duration = time.time() - transcription_start_time
+                         logger.info("Worker transcribed chunk in %.2fs: %.30s...", transcription_duration, text)
+                    except Exception as transcribe_e:
+                         # Suppress tqdm multiprocessing errors (non-fatal, see TQDM_ISSUE_ANALYSIS.md)
+                         if "fds_to_keep" not in str(transcribe_e):
+                             logger.error(f"Worker: Error during model transcription: {transcribe_e}", exc_info=True)
+                         text = None
+
+                if text:
+                    if print_queue is not None:
+                        print_queue.put_nowait(text)
+                    else:
+                        state.console.print(f"\n[dim]{text}[/dim]")
+                    results_list.append(text)
+                    state.ui_update_event.set()
+
+            except Exception as e:
+                logger.error(f"Unexpected error in transcription worker loop: {e}", exc_info=True)
+                time.sleep(0.1)
+            finally:
+                work_queue.task_done()
+    finally:
+        if io_pool is not None:
+            io_pool.shutdown(wait=True)
+        for temp_file_path in temp_file_paths:
             try:
-                 results = model.transcribe_batch([temp_file_path], source_lang=source_lang, target_lang=target_lang)
-                 if results and isinstance(results, list):
-                      text = results[0]
-                 else:
-                      text = None
-                      logger.warning(f"Worker received unexpected result type from transcribe_batch: {type(results)}")
-                 transcription_duration = time.time() - transcription_start_time
-                 logger.info(f"Worker transcribed chunk in {transcription_duration:.2f}s: {text[:30]}...")
-            except Exception as transcribe_e:
-                 # Suppress tqdm multiprocessing errors (non-fatal, see TQDM_ISSUE_ANALYSIS.md)
-                 if "fds_to_keep" not in str(transcribe_e):
-                     logger.error(f"Worker: Error during model transcription: {transcribe_e}", exc_info=True)
-                 text = None
-
-            if text:
-                state.console.print(f"\n[dim]{text}[/dim]")
-                results_list.append(text)
-
-            work_queue.task_done()
-
-        except Exception as e:
-            logger.error(f"Unexpected error in transcription worker loop (before finally): {e}", exc_info=True)
-            if audio_data is not None:
-                try:
-                    work_queue.task_done()
-                except ValueError:
-                    pass 
-            time.sleep(0.1)
-        finally:
-            if temp_file_path and os.path.exists(temp_file_path):
-                try:
-                    os.unlink(temp_file_path)
-                    logger.debug(f"Worker deleted temp file: {temp_file_path}")
-                except Exception as del_e:
-                     logger.error(f"Worker failed to delete temp file {temp_file_path}: {del_e}")
+                os.unlink(temp_file_path)
+                logger.debug("Worker deleted temp file: %s", temp_file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as del_e:
+                 logger.error(f"Worker failed to delete temp file {temp_file_path}: {del_e}")
 
     logger.info("Transcription worker thread finished normally.")
@@ -4,22 +4,27 @@ Main Textual application for ctrlSPEAK.
 
 import logging
 import asyncio
-import threading
 import gc
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from typing import Optional
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.widgets import Header, Footer, Static, Label
 from textual.reactive import reactive
+from textual.message import Message
+from textual.worker import get_current_worker
 from textual import on
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from .state import AppState
 import state
+from models.factory import ModelFactory
+from model_loader import get_model
 from .screens.recording import RecordingScreen
 from .screens.device_selection import DeviceSelectionScreen
 from .screens.help import HelpScreen
@@ -27,9 +32,72 @@ from .screens.model_selection import ModelSelectionScreen
 from .screens.log_viewer import LogViewerScreen
 from .screens.model_loading import ModelLoadingScreen
 from .screens.history import HistoryScreen
+from .widgets.accumulated_text import AccumulatedTextWidget
+from .widgets.status_bar import RecordingStatusWidget
 
 logger = logging.getLogger("ctrlspeak.ui")
 
+# How long query_devices() results are reused before PortAudio is asked again
+DEVICE_INFO_TTL_S = 10.0
+
+def _advise_willneed(path: str) -> None:
+    """Hint the OS to start reading a file into the page cache, without waiting for it."""
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        elif os.fstat(f.fileno()).st_size:
+            # macOS has no posix_fadvise; madvise on a read-only mapping does the same
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                mapped.madvise(mmap.MADV_WILLNEED)
+
+
+def _prefetch_model_files(model_name: str) -> None:
+    """
+    Warm the page cache with a model's files from the local Hugging Face cache.
+
+    Runs ahead of a likely hot swap so the load reads weights from RAM instead
+    of disk. Models that were never downloaded are skipped.
+    """
+    try:
+        from huggingface_hub import snapshot_download
+        snapshot_dir = snapshot_download(model_name, local_files_only=True)
+    except Exception as e:
+        logger.debug("Not prefetching %s: %s", model_name, e)
+        return
+
+    for root, _, files in os.walk(snapshot_dir):
+        for name in files:
+            try:
+                _advise_willneed(os.path.join(root, name))
+            except (OSError, ValueError) as e:
+                logger.debug("Prefetch hint failed for %s: %s", name, e)
+    logger.debug("Requested readahead for %s (%s)", model_name, snapshot_dir)
+
+
+# StateChanged messages arriving within this window share one UI sync (~30 fps cap)
+STATE_SYNC_DELAY_S = 0.033
+
+
+def _empty_accelerator_caches() -> None:
+    """
+    Hand memory freed by an unloaded model back to the GPU/unified memory pool.
+
+    torch and MLX keep freed buffers in their own caching allocators, which is
+    where a model's weights actually live. Only backends that are already
+    imported are touched.
+    """
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        if torch.backends.mps.is_available():
+            torch.mps.empty_cache()
+
+    mx = sys.modules.get("mlx.core")
+    if mx is not None:
+        clear_cache = getattr(mx, "clear_cache", None) or mx.metal.clear_cache
+        clear_cache()
+
 
 class CtrlSpeakApp(App):
     """
@@ -42,57 +110,8 @@ class CtrlSpeakApp(App):
     - Keyboard shortcuts
     """
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    #main-container {
-        height: 1fr;
-        width: 100%;
-    }
-
-    #recording-layout {
-        height: 100%;
-        width: 100%;
-        border: none;
-    }
-
-    RecordingScreen {
-        height: 100%;
-        width: 100%;
-        border: none;
-    }
-
-    /* Compact header with device and model info */
-    .device-info-header {
-        height: auto;
-        border: solid $accent;
-        padding: 1;
-        margin-bottom: 1;
-        width: 100%;
-    }
-
-    /* Main content area - accumulated text takes up most space */
-    .accumulated-text-main {
-        height: 1fr;
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .recording-status {
-        height: auto;
-        padding: 1;
-        margin-bottom: 1;
-    }
-
-    .help-text {
-        color: $text-muted;
-        text-align: center;
-        padding: 1;
-        margin: 0;
-    }
-    """
+    # Resolved relative to this module
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("d", "show_devices", "Devices", show=True),
@@ -107,6 +126,9 @@ class CtrlSpeakApp(App):
     TITLE = "ctrlSPEAK"
     SUB_TITLE = "Speech-to-Text Transcription"
 
+    class StateChanged(Message):
+        """Posted by the state watcher when transcriptions or recording state changed."""
+
     def __init__(
         self,
         app_state: Optional[AppState] = None,
@@ -127,12 +149,26 @@ class CtrlSpeakApp(App):
         self.audio_manager = audio_manager
         self.app_state.selected_model = model_type
         self.last_transcription_count = 0  # Track new transcriptions
+        # (is_recording, accumulated_text) as last rendered, to skip no-op refreshes
+        self._rendered_snapshot = (None, None)
+        self._state_sync_pending = False  # A coalesced sync is already scheduled
 
-        # Update interval for live data (in seconds)
-        self.update_interval = 0.1
+        # Fallback poll interval (in seconds). Changes are normally pushed via
+        # state.ui_update_event; the poll only catches anything that isn't signalled.
+        self.update_interval = 0.5
 
         # Lock to prevent concurrent model swaps
-        self.model_swap_lock = threading.Lock()
+        self.model_swap_lock = asyncio.Lock()
+        # Threads for hot_swap_model: one unloads the old model while the other
+        # loads the new one. Kept apart from the loop's default executor.
+        self._model_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="model-swap")
+
+        # device_id -> sd.query_devices(device_id), refreshed after DEVICE_INFO_TTL_S
+        self._device_info_cache = {}
+        self._device_info_cached_at = 0.0
+
+        # Model aliases whose files have already been prefetched this session
+        self._prefetched_models = set()
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -148,33 +184,75 @@ class CtrlSpeakApp(App):
         """Called when app is mounted."""
         logger.info("CtrlSpeakApp mounted")
 
-        # Set up periodic updates for live recording status
+        # Everything alive now (modules, the loaded model, the widget tree) stays
+        # for the session; keep it out of the automatic full collections
+        gc.freeze()
+
+        # React to state changes as they are signalled
+        self.run_worker(self._watch_state_changes, thread=True, name="state-watcher")
+
+        # Slow liveness poll for live recording status
         self.set_interval(self.update_interval, self.update_recording_state)
 
+    def on_unmount(self) -> None:
+        """Called when app is unmounted."""
+        # Don't hold up exit for a swap still in progress
+        self._model_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _watch_state_changes(self) -> None:
+        """Worker thread: turn state.ui_update_event into StateChanged messages."""
+        worker = get_current_worker()
+        while not worker.is_cancelled:
+            # Timeout only bounds how long cancellation on exit can take
+            if state.ui_update_event.wait(timeout=self.update_interval):
+                state.ui_update_event.clear()
+                self.post_message(self.StateChanged())
+
+    @on(StateChanged)
+    def on_state_changed(self) -> None:
+        """Schedule one UI sync for a burst of changes reported by the watcher."""
+        if not self._state_sync_pending:
+            self._state_sync_pending = True
+            self.set_timer(STATE_SYNC_DELAY_S, self._flush_state_changes)
+
+    def _flush_state_changes(self) -> None:
+        """Apply the changes coalesced since the first StateChanged of the burst."""
+        self._state_sync_pending = False
+        self.update_recording_state()
+
     def update_recording_state(self) -> None:
-        """Periodically update recording state from audio manager and sync transcribed chunks."""
+        """Update recording state from audio manager and sync transcribed chunks."""
         if self.audio_manager:
             self.app_state.update_from_audio_manager(self.audio_manager)
 
+        # Read the length once: the worker thread may append while we sync, and
+        # anything past chunk_count is picked up on the next update
+        chunk_count = len(state.transcribed_chunks)
+
         # Detect if transcribed_chunks was cleared (new recording started)
-        if len(state.transcribed_chunks) < self.last_transcription_count:
-            logger.debug(f"Detected chunks cleared, resetting last_transcription_count from {self.last_transcription_count} to 0")
+        if chunk_count < self.last_transcription_count:
+            logger.debug("Detected chunks cleared, resetting last_transcription_count from %d to 0", self.last_transcription_count)
             self.last_transcription_count = 0
 
         # Sync new transcribed chunks into accumulated text
-        if len(state.transcribed_chunks) > self.last_transcription_count:
-            new_chunks = state.transcribed_chunks[self.last_transcription_count:]
-            for chunk_text in new_chunks:
-                if chunk_text:
-                    # Add space between chunks if text already exists
-                    if self.app_state.accumulated_text.strip():
-                        self.app_state.accumulated_text += " " + chunk_text.strip()
-                    else:
-                        self.app_state.accumulated_text = chunk_text.strip()
-            self.last_transcription_count = len(state.transcribed_chunks)
-
-        # Notify the recording screen to refresh
-        self.refresh()
+        if chunk_count > self.last_transcription_count:
+            # islice walks the new chunks in place rather than copying them into a slice
+            new_chunks = islice(state.transcribed_chunks, self.last_transcription_count, chunk_count)
+            # One extend, joined once on the next render, instead of re-copying the text per chunk
+            self.app_state.append_text(
+                stripped for chunk_text in new_chunks if chunk_text and (stripped := chunk_text.strip())
+            )
+            self.last_transcription_count = chunk_count
+
+        # Repaint only the widgets whose data changed (nothing, on most ticks)
+        is_recording = self.app_state.is_recording
+        text = self.app_state.accumulated_text
+        rendered_recording, rendered_text = self._rendered_snapshot
+        if text != rendered_text:
+            self.query(AccumulatedTextWidget).refresh()
+        if is_recording != rendered_recording:
+            self.query(RecordingStatusWidget).refresh()
+        self._rendered_snapshot = (is_recording, text)
 
     async def action_show_devices(self) -> None:
         """Show device selection screen."""
@@ -187,8 +265,26 @@ class CtrlSpeakApp(App):
     async def action_show_models(self) -> None:
         """Show model selection screen."""
         logger.info("Model selection requested")
+        # The saved preference is the most likely swap target; start reading it now
+        self.prefetch_model(self.app_state.selected_model)
         await self.push_screen(ModelSelectionScreen(app_state=self.app_state))
 
+    def prefetch_model(self, model_alias: str) -> None:
+        """
+        Start pulling a model's cached files into the OS page cache in the background.
+
+        Does nothing for the loaded model or a model already prefetched this session.
+
+        Args:
+            model_alias: Model alias that is likely to be swapped to next
+        """
+        if model_alias == self.app_state.loaded_model or model_alias in self._prefetched_models:
+            return
+        self._prefetched_models.add(model_alias)
+        model_name = ModelFactory.resolve_model_alias(model_alias)
+        self.run_worker(partial(_prefetch_model_files, model_name), thread=True,
+                        name=f"prefetch-{model_alias}", group="model-prefetch")
+
     async def action_show_history(self) -> None:
         """Show history screen."""
         logger.info("History screen requested")
@@ -202,7 +298,12 @@ class CtrlSpeakApp(App):
     async def action_show_help(self) -> None:
         """Show help screen."""
         logger.info("Help screen requested")
-        await self.push_screen(HelpScreen(app_state=self.app_state))
+        # Installed once and reused, so the help text is only parsed and laid out on first open
+        if not self.is_screen_installed("help"):
+            self.install_screen(HelpScreen(app_state=self.app_state), name="help")
+        elif self.get_screen("help") in self.screen_stack:
+            return
+        await self.push_screen("help")
 
     async def action_quit(self) -> None:
         """Quit the application."""
@@ -214,13 +315,13 @@ class CtrlSpeakApp(App):
         Hot-swap to a new model without restarting the application.
 
         Steps:
-        1. Show loading screen
-        2. Resolve model alias to full name
+        1. Resolve model alias to full name
+        2. Show loading screen
         3. Update state.model_type
-        4. Unload old model (free memory)
-        5. Load new model in background thread
-        6. Update state.stt_model and app_state.loaded_model
-        7. Dismiss loading dialog
+        4. Unload old model (free memory) and load new model, concurrently
+           in background threads
+        5. Update state.stt_model and app_state.loaded_model
+        6. Dismiss loading dialog
 
         Args:
             new_model_alias: Model alias to swap to (e.g., "parakeet-v3")
@@ -228,18 +329,26 @@ class CtrlSpeakApp(App):
         Returns:
             True if swap was successful, False otherwise
         """
-        from models.factory import ModelFactory
-        from model_loader import get_model
-
         # Acquire lock to prevent concurrent swaps
-        if not self.model_swap_lock.acquire(blocking=False):
+        if self.model_swap_lock.locked():
             logger.warning("Model swap already in progress")
             self.notify("Model swap already in progress", severity="warning")
             return False
+        # Uncontended, so this returns without yielding to another swap
+        await self.model_swap_lock.acquire()
 
         loading_screen = None
 
         try:
+            # Resolve before showing anything: a bad alias only needs a toast
+            try:
+                full_model_name = ModelFactory.resolve_model_alias(new_model_alias)
+                logger.info(f"Resolved {new_model_alias} to {full_model_name}")
+            except Exception as e:
+                logger.error(f"Error resolving model alias: {e}")
+                self.notify(f"Failed to resolve model: {e}", severity="error", timeout=5)
+                return False
+
             # Mark as loading
             self.app_state.is_loading_model = True
             self.app_state.model_load_progress = "Initializing..."
@@ -248,42 +357,35 @@ class CtrlSpeakApp(App):
             loading_screen = ModelLoadingScreen(new_model_alias)
             await self.push_screen(loading_screen)
 
-            # Update progress: "Resolving model..."
-            loading_screen.update_status("Resolving model name...")
-            await asyncio.sleep(0.1)  # Give UI time to update
-
-            try:
-                full_model_name = ModelFactory.resolve_model_alias(new_model_alias)
-                logger.info(f"Resolved {new_model_alias} to {full_model_name}")
-            except Exception as e:
-                logger.error(f"Error resolving model alias: {e}")
-                loading_screen.update_status(f"Error: {e}", error=True)
-                await asyncio.sleep(2)
-                self.notify(f"Failed to resolve model: {e}", severity="error")
-                return False
-
             # Update global state
             old_model_type = state.model_type
             state.model_type = full_model_name
             logger.info(f"Updated state.model_type from {old_model_type} to {full_model_name}")
 
-            # Update progress: "Unloading old model..."
-            loading_screen.update_status("Unloading previous model...")
-            self.app_state.model_load_progress = "Unloading previous model..."
-            await asyncio.sleep(0.1)
+            # Update progress: "Loading new model..."
+            loading_screen.update_status(f"Loading {full_model_name}...")
+            self.app_state.model_load_progress = f"Loading {full_model_name}..."
+            await asyncio.sleep(0)  # One loop pass is enough for the UI to repaint
 
-            # Unload old model
-            old_model = state.stt_model
+            # Detach the old model; its only remaining reference lives in
+            # old_models so the unload thread can drop it
+            old_models = [state.stt_model]
             state.stt_model = None
             state.model_loaded = False
-            del old_model
-            gc.collect()
-            logger.info("Old model unloaded and memory freed")
 
-            # Update progress: "Loading new model..."
-            loading_screen.update_status(f"Loading {full_model_name}...")
-            self.app_state.model_load_progress = f"Loading {full_model_name}..."
-            await asyncio.sleep(0.1)
+            def unload_model_thread():
+                old_models.clear()
+                # A plain full collection: the gc freeze from on_mount is left alone,
+                # since unfreezing here would let the next freeze capture whatever
+                # the loader thread has half-built. Frozen objects are still freed
+                # by refcounting once their last reference goes.
+                gc.collect(2)
+                try:
+                    _empty_accelerator_caches()
+                except Exception as e:
+                    logger.warning(f"Could not empty accelerator caches: {e}")
+                # Not necessarily freed yet: the running transcription worker holds its own reference
+                logger.info("Dropped the swap's reference to the old model and emptied accelerator caches")
 
             # Load in background thread to avoid blocking UI
             error_message = None
@@ -298,17 +400,20 @@ class CtrlSpeakApp(App):
                     error_message = str(e)
                     return None
 
-            # Run in executor
-            loop = asyncio.get_event_loop()
-            new_model = await loop.run_in_executor(None, load_model_thread)
+            # Free the old model while the new one loads, both off the event loop
+            loop = asyncio.get_running_loop()
+            _, new_model = await asyncio.gather(
+                loop.run_in_executor(self._model_executor, unload_model_thread),
+                loop.run_in_executor(self._model_executor, load_model_thread),
+            )
 
             if not new_model:
                 # Show the actual error message to the user
                 error_display = error_message or "Unknown error"
                 loading_screen.update_status(f"Failed: {error_display}", error=True)
                 self.app_state.model_load_progress = f"Failed: {error_display}"
-                await asyncio.sleep(3)  # Give more time to read error
-                self.notify(f"Model loading failed: {error_display}", severity="error")
+                # The loading screen closes right away; the toast keeps the error readable
+                self.notify(f"Model loading failed: {error_display}", severity="error", timeout=8)
 
                 # Restore old model type
                 state.model_type = old_model_type
@@ -324,9 +429,8 @@ class CtrlSpeakApp(App):
 
             loading_screen.update_status("Model loaded successfully!")
             self.app_state.model_load_progress = "Model loaded successfully!"
-            await asyncio.sleep(1)
 
-            self.notify(f"Switched to {new_model_alias}", severity="information")
+            self.notify(f"Switched to {new_model_alias}", severity="information", timeout=3)
             return True
 
         except Exception as e:
@@ -347,6 +451,30 @@ class CtrlSpeakApp(App):
             self.model_swap_lock.release()
             logger.info("Model swap lock released")
 
+    def _query_device(self, device_id: int) -> dict:
+        """
+        sd.query_devices(device_id), cached for DEVICE_INFO_TTL_S.
+
+        The device list rarely changes mid-session, so repeat swaps skip the
+        PortAudio enumeration. Lookup errors are not cached.
+        """
+        now = time.monotonic()
+        if now - self._device_info_cached_at > DEVICE_INFO_TTL_S:
+            self._device_info_cache.clear()
+            self._device_info_cached_at = now
+
+        device_info = self._device_info_cache.get(device_id)
+        if device_info is None:
+            import sounddevice as sd
+            device_info = sd.query_devices(device_id)
+            self._device_info_cache[device_id] = device_info
+        return device_info
+
+    def _invalidate_device_caches(self) -> None:
+        """Drop cached device info so the next lookup re-enumerates."""
+        self._device_info_cache.clear()
+        self.app_state.invalidate_devices()
+
     async def hot_swap_device(self, new_device_id: int) -> bool:
         """
         Hot-swap to a new audio input device without restarting the application.
@@ -368,14 +496,14 @@ class CtrlSpeakApp(App):
         try:
             # Validate device exists
             try:
-                import sounddevice as sd
-                device_info = sd.query_devices(new_device_id)
+                device_info = self._query_device(new_device_id)
                 if device_info['max_input_channels'] <= 0:
                     raise ValueError(f"Device {new_device_id} has no input channels")
                 logger.info(f"Target device: {device_info['name']}")
             except Exception as e:
                 logger.error(f"Invalid device {new_device_id}: {e}")
                 self.notify(f"Invalid device: {e}", severity="error")
+                self._invalidate_device_caches()
                 return False
 
             # Restart the audio stream with the new device
@@ -386,6 +514,8 @@ class CtrlSpeakApp(App):
             except Exception as e:
                 logger.error(f"Failed to restart audio stream: {e}")
                 self.notify(f"Failed to switch device: {e}", severity="error")
+                # The device may have been unplugged; don't keep offering it
+                self._invalidate_device_caches()
                 return False
 
             # Update app state
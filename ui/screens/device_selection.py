@@ -3,7 +3,8 @@ Device selection screen for ctrlSPEAK.
 """
 
 import logging
-import sounddevice as sd
+import time
+from rich.text import Text
 from textual.screen import Screen
 from textual.containers import Container, Vertical
 from textual.widgets import Static, Label, ListItem, ListView
@@ -15,6 +16,9 @@ from ..state import AppState, DeviceInfo
 
 logger = logging.getLogger("ctrlspeak.ui.device_selection")
 
+# How long an enumerated device list is reused before PortAudio is asked again
+DEVICE_LIST_TTL_S = 5.0
+
 
 class DeviceListItem(ListItem):
     """Custom list item for audio devices."""
@@ -29,18 +33,21 @@ class DeviceListItem(ListItem):
             is_selected: This device is saved as preference for next launch
         """
         self.device = device
-        device_text = f"{device.name} (Device #{device.id})"
         device_specs = f"{device.channels}ch @ {device.sample_rate/1000:.1f}kHz"
 
-        # Show status tags
+        # Status tag, if any (styled spans, so no markup parsing per item)
         if is_active:
-            device_text += " [green][ACTIVE][/green]"
+            status_tag = (" [ACTIVE]", "green")
         elif is_selected:
-            device_text += " [dim][PREFERRED][/dim]"
+            status_tag = (" [PREFERRED]", "dim")
         elif device.is_default:
-            device_text += " [dim][DEFAULT][/dim]"
+            status_tag = (" [DEFAULT]", "dim")
+        else:
+            status_tag = ""
 
-        label_text = f"{device_text} - {device_specs}"
+        label_text = Text.assemble(
+            f"{device.name} (Device #{device.id})", status_tag, f" - {device_specs}"
+        )
         super().__init__(Label(label_text), id=f"device-{device.id}", **kwargs)
 
 
@@ -83,59 +90,94 @@ class DeviceSelectionScreen(Screen):
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        with Container():
+        with Container(id="device-container"):
             yield Label("🎤 Audio Input Devices", classes="screen-title")
             yield Label("Select an audio input device:", classes="help-text")
+            # Items are added in one batch by _show_devices once the devices are known
+            yield ListView(id="device-list")
+            yield Label("Loading devices…", id="devices-status", classes="help-text")
+            yield Label("↑↓ Navigate • Enter to Select • Esc to Go Back", classes="help-text")
+            yield Label("[green]Device will switch immediately[/green]", classes="help-text")
 
-            # Get available devices
-            self.devices = self.get_available_devices()
-
-            if not self.devices:
-                yield Label("[red]No audio input devices found![/red]", classes="help-text")
-                yield Label("Press Esc to go back", classes="help-text")
-                return
-
-            # Create interactive list view with current selection marked
-            device_list = ListView(
-                *[
-                    DeviceListItem(
-                        device,
-                        is_active=(device.id == self.app_state.loaded_device),  # Actually active device
-                        is_selected=(device.id == self.app_state.selected_device)  # Saved preference
-                    )
-                    for device in self.devices
-                ],
-                id="device-list"
+    def _load_devices(self) -> None:
+        """Worker thread: enumerate devices, then show them on the UI thread."""
+        devices = self.get_available_devices()
+        self.app.call_from_thread(self._show_devices, devices)
+
+    async def _show_devices(self, devices: list[DeviceInfo]) -> None:
+        """Fill the device list (or show the no-devices message) for devices."""
+        if not self.is_attached:
+            return  # Screen was closed while enumerating
+        self.devices = devices
+        status = self.query_one("#devices-status", Label)
+        device_list = self.query_one("#device-list", ListView)
+
+        if not self.devices:
+            device_list.display = False
+            status.update("[red]No audio input devices found![/red]")
+            return
+
+        status.display = False
+        # Mount every item in one call, with current selection marked
+        await device_list.extend(
+            DeviceListItem(
+                device,
+                is_active=(device.id == self.app_state.loaded_device),  # Actually active device
+                is_selected=(device.id == self.app_state.selected_device)  # Saved preference
             )
-            yield device_list
+            for device in self.devices
+        )
+        device_list.index = 0
+        device_list.focus()
 
-            yield Label("↑↓ Navigate • Enter to Select • Esc to Go Back", classes="help-text")
-            yield Label("[green]Device will switch immediately[/green]", classes="help-text")
+    def _devices_fresh(self) -> bool:
+        """Whether app_state holds a device list enumerated within DEVICE_LIST_TTL_S."""
+        enumerated_at = self.app_state.devices_enumerated_at
+        return enumerated_at is not None and time.monotonic() - enumerated_at < DEVICE_LIST_TTL_S
+
+    @staticmethod
+    def _device_key(device: DeviceInfo) -> tuple:
+        """Everything that identifies an enumerated device and how it's shown."""
+        return (device.id, device.name, device.channels, device.sample_rate, device.is_default)
 
     def get_available_devices(self) -> list[DeviceInfo]:
         """
         Get list of available audio input devices.
 
+        The list is cached on app_state for DEVICE_LIST_TTL_S, so reopening the
+        screen doesn't re-enumerate PortAudio devices. A failed enumeration is
+        not cached.
+
         Returns:
             List of DeviceInfo objects
         """
+        if self._devices_fresh():
+            return self.app_state.available_devices
+
         devices = []
+        # DeviceInfo objects from the last enumeration, reused for devices that
+        # haven't changed; devices that disappeared simply aren't carried over
+        previous = {self._device_key(d): d for d in self.app_state.available_devices}
         try:
+            import sounddevice as sd
             all_devices = sd.query_devices()
             default_device_id = sd.default.device[0] if sd.default.device else None
 
             for i, device in enumerate(all_devices):
                 # Only include input devices (those with input channels)
                 if device['max_input_channels'] > 0:
-                    devices.append(DeviceInfo(
+                    info = DeviceInfo(
                         id=i,
                         name=device['name'],
                         channels=device['max_input_channels'],
                         sample_rate=int(device['default_samplerate']),
                         is_default=(i == default_device_id)
-                    ))
+                    )
+                    devices.append(previous.get(self._device_key(info), info))
 
             logger.info(f"Found {len(devices)} input devices")
+            self.app_state.available_devices = devices
+            self.app_state.devices_enumerated_at = time.monotonic()
 
         except Exception as e:
             logger.error(f"Error enumerating devices: {e}")
@@ -187,6 +229,11 @@ class DeviceSelectionScreen(Screen):
         else:
             logger.error(f"Hot swap to device {selected_device.id} failed")
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Called when screen is mounted."""
         logger.info("DeviceSelectionScreen mounted")
+        if self._devices_fresh():
+            await self._show_devices(self.app_state.available_devices)
+        else:
+            # Enumerating can take a while, so it's done off the UI thread
+            self.run_worker(self._load_devices, thread=True, exclusive=True, name="device-enumeration")
@@ -3,9 +3,10 @@ Help and information screen for ctrlSPEAK.
 """
 
 import logging
+from rich.markdown import Markdown as RichMarkdown
 from textual.screen import Screen
 from textual.containers import Container, Vertical, ScrollableContainer
-from textual.widgets import Static, Label, Markdown
+from textual.widgets import Static, Label
 from textual.app import ComposeResult
 from textual.binding import Binding
 
@@ -82,6 +83,10 @@ Repository: https://github.com/patelnav/ctrlspeak
 Press **Esc** to close this help screen.
 """
 
+# Parsed once at import and drawn by a single Static, rather than a Markdown
+# widget that re-parses the text and builds a widget per block
+_HELP_RENDERABLE = RichMarkdown(HELP_TEXT)
+
 
 class HelpScreen(Screen):
     """
@@ -126,7 +131,7 @@ class HelpScreen(Screen):
         """Create child widgets."""
         with Container(id="help-container"):
             with ScrollableContainer():
-                yield Markdown(HELP_TEXT)
+                yield Static(_HELP_RENDERABLE, expand=True)
 
     def action_dismiss(self) -> None:
         """Dismiss the screen and go back."""
@@ -5,13 +5,18 @@ Browse, view, copy, and delete past transcriptions.
 """
 
 import logging
+from functools import partial
+from typing import List, Optional
 
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen, Screen
-from textual.widgets import Button, Label, ListItem, ListView
+from textual.timer import Timer
+from textual.widgets import Button, Label, OptionList
+from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
 import state
 from utils.clipboard import copy_to_clipboard
@@ -21,6 +26,19 @@ from ..state import AppState
 
 logger = logging.getLogger("ctrlspeak.ui.history")
 
+# Entries fetched per page; the next page is loaded as the highlight nears the
+# end of what's loaded. OptionList only renders the rows on screen.
+HISTORY_PAGE_SIZE = 100
+HISTORY_PAGE_MARGIN = 10
+
+# Selections closer together than this (repeated Enter, double clicks) only copy
+# the last one
+COPY_DEBOUNCE_S = 0.25
+
+# Name the delete confirmation dialog is installed under, so one instance is
+# reused for every delete (and every visit to the history screen)
+DELETE_DIALOG_NAME = "delete-confirm"
+
 
 class DeleteConfirmDialog(ModalScreen):
     """Confirmation dialog for deleting history entry."""
@@ -75,11 +93,20 @@ class DeleteConfirmDialog(ModalScreen):
     def compose(self) -> ComposeResult:
         with Container(id="dialog"):
             yield Label("⚠️  Delete this transcription?", id="question")
-            yield Label(f'"{self.entry_preview[:50]}..."', id="preview")
+            yield Label(self._preview_text(), id="preview")
             with Horizontal(id="buttons"):
                 yield Button("Cancel (Esc)", variant="default", id="cancel")
                 yield Button("Delete", variant="error", id="confirm")
 
+    def _preview_text(self) -> str:
+        return f'"{self.entry_preview[:50]}..."'
+
+    def update_preview(self, entry_preview: str) -> None:
+        """Show a different entry's preview when the dialog is reused."""
+        self.entry_preview = entry_preview
+        if self.is_mounted:
+            self.query_one("#preview", Label).update(self._preview_text())
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         self.dismiss(event.button.id == "confirm")
 
@@ -87,10 +114,10 @@ class DeleteConfirmDialog(ModalScreen):
         self.dismiss(False)
 
 
-class HistoryListItem(ListItem):
-    """Custom list item for history entries."""
+class HistoryOption(Option):
+    """Option list row for a history entry."""
 
-    def __init__(self, entry: HistoryEntry, **kwargs):
+    def __init__(self, entry: HistoryEntry):
         """
         Initialize with history entry.
 
@@ -98,20 +125,7 @@ class HistoryListItem(ListItem):
             entry: HistoryEntry object
         """
         self.entry = entry
-
-        # Format: timestamp | preview (first 60 chars) | model | duration
-        timestamp_str = entry.formatted_timestamp
-        preview = (
-            entry.preview[:60] + "..."
-            if len(entry.preview) > 60
-            else entry.preview
-        )
-        duration_str = f"{entry.duration_seconds:.1f}s"
-
-        # Build the display text
-        entry_text = f"[cyan]{timestamp_str}[/cyan] | [dim]{entry.model}[/dim] | [yellow]{duration_str}[/yellow]\n  {preview}"
-
-        super().__init__(Label(entry_text), id=f"history-{entry.id}", **kwargs)
+        super().__init__(entry.display_text, id=f"history-{entry.id}")
 
 
 class HistoryScreen(Screen):
@@ -134,22 +148,16 @@ class HistoryScreen(Screen):
         color: $accent;
     }
 
-    ListView {
+    OptionList {
         height: 1fr;
         border: solid $primary;
         margin-bottom: 1;
     }
 
-    ListItem {
-        height: auto;
+    OptionList > .option-list--option {
         padding: 1;
     }
 
-    ListItem:focus {
-        background: $accent;
-        color: $text;
-    }
-
     .stats-text {
         color: $text-muted;
         text-align: center;
@@ -183,48 +191,61 @@ class HistoryScreen(Screen):
         super().__init__(**kwargs)
         self.app_state = app_state
         self.entries = []
+        self.all_loaded = False  # True once the last page has been fetched
+        self._copy_timer: Optional[Timer] = None  # Pending debounced copy from a selection
+        self.history_list: Optional[OptionList] = None  # None once there's nothing to list
         self.history_manager = get_history_manager(state.history_db_path)
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        with Container():
+        with Container(id="history-container"):
             yield Label("📜 Transcription History", classes="screen-title")
+            # Filled in by _show_entries once the worker has read the database
+            self.stats_label = Label("Loading history…", classes="stats-text")
+            yield self.stats_label
 
-            # Get history entries
-            self.entries = self.history_manager.get_recent(limit=100)
-
-            if not self.entries:
-                yield Label(
-                    "[yellow]No transcription history yet.[/yellow]",
-                    classes="help-text",
-                )
-                yield Label(
-                    "Start recording to create history entries!",
-                    classes="help-text",
-                )
-                yield Label("Press Esc to go back", classes="help-text")
-                return
-
-            # Show statistics
-            stats = self.history_manager.get_stats()
-            stats_text = (
-                f"Total: {stats['total_entries']} entries | "
-                f"~{stats['total_words']:,} words | "
-                f"~{stats['total_duration'] / 60:.1f} minutes recorded"
-            )
-            yield Label(stats_text, classes="stats-text")
-
-            # Create interactive list view
-            history_list = ListView(
-                *[HistoryListItem(entry) for entry in self.entries],
-                id="history-list",
-            )
-            yield history_list
+            # Rows are rendered on demand, so no widget is mounted per entry
+            self.history_list = OptionList(id="history-list")
+            yield self.history_list
 
-            yield Label(
+            self.help_label = Label(
                 "↑↓ Navigate • Enter/c to Copy • d to Remove • Esc to Go Back",
                 classes="help-text",
             )
+            yield self.help_label
+
+    def _load_entries(self) -> None:
+        """Worker thread: read the first page and stats, then show them on the UI thread."""
+        entries = self.history_manager.get_page(limit=HISTORY_PAGE_SIZE)
+        stats = self.history_manager.get_stats() if entries else None
+        self.app.call_from_thread(self._show_entries, entries, stats)
+
+    async def _show_entries(self, entries: List[HistoryEntry], stats: Optional[dict]) -> None:
+        """Fill the list with the first page (or say there's no history yet)."""
+        if not self.is_attached:
+            return  # Screen was closed while loading
+        self.entries = entries
+        self.all_loaded = len(entries) < HISTORY_PAGE_SIZE
+
+        if not self.entries:
+            history_list, self.history_list = self.history_list, None
+            await history_list.remove()
+            await self.stats_label.remove()
+            await self.help_label.remove()
+            await self.query_one("#history-container", Container).mount_all([
+                Label("[yellow]No transcription history yet.[/yellow]", classes="help-text"),
+                Label("Start recording to create history entries!", classes="help-text"),
+                Label("Press Esc to go back", classes="help-text"),
+            ])
+            return
+
+        self.stats_label.update(
+            f"Total: {stats['total_entries']} entries | "
+            f"~{stats['total_words']:,} words | "
+            f"~{stats['total_duration'] / 60:.1f} minutes recorded"
+        )
+        self.history_list.add_options([HistoryOption(entry) for entry in self.entries])
+        self.history_list.highlighted = 0
 
     def action_dismiss(self) -> None:
         """Dismiss the screen and go back."""
@@ -232,8 +253,7 @@ class HistoryScreen(Screen):
 
     def action_copy_selected(self) -> None:
         """Copy the selected entry to clipboard."""
-        history_list = self.query_one("#history-list", ListView)
-        selected_index = history_list.index
+        selected_index = self.history_list.highlighted if self.history_list else None
 
         if (
             selected_index is None
@@ -243,22 +263,39 @@ class HistoryScreen(Screen):
             self.app.notify("No entry selected", severity="warning")
             return
 
-        entry = self.entries[selected_index]
+        self.copy_entry(self.entries[selected_index])
+
+    def copy_entry(self, entry: HistoryEntry) -> None:
+        """Copy an entry's text to the clipboard without blocking the UI."""
+        # pyperclip runs pbcopy/xclip, which can take a while for long texts.
+        # exclusive: a copy that hasn't started yet is dropped for a newer one.
+        self.run_worker(
+            partial(self._copy_entry_thread, entry),
+            thread=True,
+            exclusive=True,
+            group="clipboard",
+        )
+
+    def _copy_entry_thread(self, entry: HistoryEntry) -> None:
+        """Worker thread: copy to the clipboard and report the result."""
+        if get_current_worker().is_cancelled:
+            return
         try:
             copy_to_clipboard(entry.text)
-            self.app.notify(
-                f"Copied to clipboard ({len(entry.text)} chars)",
-                severity="information",
-            )
-            logger.info(f"Copied history entry {entry.id} to clipboard")
         except Exception as e:
             logger.error(f"Failed to copy to clipboard: {e}")
-            self.app.notify("Failed to copy to clipboard", severity="error")
+            self.app.call_from_thread(self.app.notify, "Failed to copy to clipboard", severity="error")
+            return
+        self.app.call_from_thread(
+            self.app.notify,
+            f"Copied to clipboard ({len(entry.text)} chars)",
+            severity="information",
+        )
+        logger.info(f"Copied history entry {entry.id} to clipboard")
 
     def action_delete_selected(self) -> None:
         """Delete the selected entry after confirmation."""
-        history_list = self.query_one("#history-list", ListView)
-        selected_index = history_list.index
+        selected_index = self.history_list.highlighted if self.history_list else None
 
         if (
             selected_index is None
@@ -276,9 +313,14 @@ class HistoryScreen(Screen):
     async def _delete_with_confirmation(self, entry: HistoryEntry) -> None:
         """Show confirmation dialog and delete entry if confirmed."""
 
-        confirmed = await self.app.push_screen_wait(
-            DeleteConfirmDialog(entry_preview=entry.preview)
-        )
+        if self.app.is_screen_installed(DELETE_DIALOG_NAME):
+            dialog = self.app.get_screen(DELETE_DIALOG_NAME)
+            dialog.update_preview(entry.preview)
+        else:
+            dialog = DeleteConfirmDialog(entry_preview=entry.preview)
+            self.app.install_screen(dialog, name=DELETE_DIALOG_NAME)
+
+        confirmed = await self.app.push_screen_wait(dialog)
 
         if not confirmed:
             return
@@ -289,46 +331,48 @@ class HistoryScreen(Screen):
                 f"Deleted entry from {entry.formatted_timestamp}",
                 severity="information",
             )
-            await self.refresh_entries()
+            self.remove_entry(entry)
         else:
             self.app.notify("Failed to delete entry", severity="error")
 
-    async def refresh_entries(self) -> None:
-        """Refresh the history list after changes."""
-        # Get updated entries from database
-        new_entries = self.history_manager.get_recent(limit=100)
-
-        # Get the ListView
-        try:
-            history_list = self.query_one("#history-list", ListView)
-        except Exception:
+    def remove_entry(self, entry: HistoryEntry) -> None:
+        """Drop a deleted entry's row, leaving the rest of the list as it is."""
+        if self.history_list is None:
             return
 
-        if not new_entries:
+        self.entries = [e for e in self.entries if e.id != entry.id]
+        if not self.entries and not self.all_loaded:
+            # Older entries may still be unloaded; the deleted one marks where they start
+            self.load_next_page(after=entry)
+        if not self.entries:
             # No more entries - close the screen
             self.app.notify("History is now empty", severity="information")
             self.dismiss()
             return
 
-        # Update our local cache
-        self.entries = new_entries
-
-        # Clear the list first and wait for it to complete
-        await history_list.clear()
-
-        # Add all entries back using extend (more efficient than multiple appends)
-        new_items = [HistoryListItem(entry) for entry in self.entries]
-        await history_list.extend(new_items)
+        # OptionList keeps the highlight on the row that moves into the gap
+        self.history_list.remove_option(f"history-{entry.id}")
+
+    def load_next_page(self, after: Optional[HistoryEntry] = None) -> None:
+        """Append the next page of entries older than after (default: the last loaded one)."""
+        page = self.history_manager.get_page(limit=HISTORY_PAGE_SIZE, after=after or self.entries[-1])
+        self.all_loaded = len(page) < HISTORY_PAGE_SIZE
+        if page:
+            self.entries.extend(page)
+            self.history_list.add_options(
+                [HistoryOption(entry) for entry in page]
+            )
 
-        # Select first item
-        if len(self.entries) > 0:
-            history_list.index = 0
+    @on(OptionList.OptionHighlighted)
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        """Fetch more entries before the highlight reaches the end of the list."""
+        if not self.all_loaded and event.option_index >= len(self.entries) - HISTORY_PAGE_MARGIN:
+            self.load_next_page()
 
-    @on(ListView.Selected)
-    async def on_list_view_selected(self, event: ListView.Selected) -> None:
+    @on(OptionList.OptionSelected)
+    async def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle entry selection - copy to clipboard."""
-        history_list: ListView = event.control
-        selected_index = history_list.index
+        selected_index = event.option_index
 
         if (
             selected_index is None
@@ -338,20 +382,15 @@ class HistoryScreen(Screen):
             logger.warning(f"Invalid history index: {selected_index}")
             return
 
-        entry = self.entries[selected_index]
-
-        # Copy to clipboard
-        try:
-            copy_to_clipboard(entry.text)
-            self.app.notify(
-                f"Copied to clipboard ({len(entry.text)} chars)",
-                severity="information",
-            )
-            logger.info(f"Copied history entry {entry.id} to clipboard")
-        except Exception as e:
-            logger.error(f"Failed to copy to clipboard: {e}")
-            self.app.notify("Failed to copy to clipboard", severity="error")
+        # Copy to clipboard once selections settle
+        if self._copy_timer is not None:
+            self._copy_timer.stop()
+        self._copy_timer = self.set_timer(
+            COPY_DEBOUNCE_S, partial(self.copy_entry, self.entries[selected_index])
+        )
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
         logger.info("HistoryScreen mounted")
+        # The query runs off the UI thread, so a slow or busy database doesn't stall opening
+        self.run_worker(self._load_entries, thread=True, exclusive=True, name="history-load")
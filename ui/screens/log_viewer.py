@@ -3,6 +3,7 @@ Log viewer screen for ctrlSPEAK.
 """
 
 import logging
+import re
 from pathlib import Path
 from textual.screen import Screen
 from textual.containers import Container, ScrollableContainer
@@ -16,6 +17,13 @@ from ..state import AppState
 
 logger = logging.getLogger("ctrlspeak.ui.log_viewer")
 
+# A log line and its level (the first " - LEVEL - " field), and the style for each level
+_LEVEL_RE = re.compile(r'^.*? - (ERROR|WARNING|INFO|DEBUG) - .*$', re.MULTILINE)
+_LEVEL_STYLES = {'ERROR': 'red', 'WARNING': 'yellow', 'INFO': 'cyan', 'DEBUG': 'dim'}
+
+# Bytes read from the end of the log at first; doubled until it holds enough lines
+LOG_TAIL_BYTES = 64 * 1024
+
 
 class LogViewerScreen(Screen):
     """
@@ -40,6 +48,8 @@ class LogViewerScreen(Screen):
         super().__init__(**kwargs)
         self.app_state = app_state
         self.log_content = Static(id="log-content")
+        self._log_offset = 0  # File offset the last read ended at
+        self._log_lines: list[str] = []  # Formatted lines currently shown
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -60,6 +70,10 @@ class LogViewerScreen(Screen):
         """
         Load recent logs from the log file.
 
+        The first call reads the tail of the file; later calls only read what
+        was appended since, starting from the offset the last read ended at.
+        If the file shrank (rotated or truncated) the tail is read again.
+
         Args:
             lines: Number of recent lines to load
 
@@ -69,42 +83,88 @@ class LogViewerScreen(Screen):
         log_file = self.get_log_file_path()
 
         if not log_file.exists():
+            self._log_offset = 0
             return "[yellow]No log file found yet. Logs will appear as you use the application.[/yellow]"
 
         try:
-            # Read all lines
-            with open(log_file, 'r') as f:
-                all_lines = f.readlines()
-
-            # Get last N lines
-            recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-
-            if not recent_lines:
+            size = log_file.stat().st_size
+            if self._log_offset == 0 or size < self._log_offset:
+                new_text, self._log_offset = self._read_tail(log_file, lines)
+                self._log_lines = []
+            elif size > self._log_offset:
+                new_text, self._log_offset = self._read_from(log_file, self._log_offset)
+            else:
+                new_text = ""
+
+            if new_text:
+                self._log_lines.extend(self._format_lines(new_text))
+                del self._log_lines[:-lines]
+
+            if not self._log_lines:
                 return "[dim]Log file is empty[/dim]"
 
-            # Format logs with styling
-            formatted_lines = []
-            for line in recent_lines:
-                line = line.rstrip('\n')
-
-                # Color code by log level
-                if ' - ERROR - ' in line:
-                    formatted_lines.append(f"[red]{line}[/red]")
-                elif ' - WARNING - ' in line:
-                    formatted_lines.append(f"[yellow]{line}[/yellow]")
-                elif ' - INFO - ' in line:
-                    formatted_lines.append(f"[cyan]{line}[/cyan]")
-                elif ' - DEBUG - ' in line:
-                    formatted_lines.append(f"[dim]{line}[/dim]")
-                else:
-                    formatted_lines.append(line)
-
-            return "\n".join(formatted_lines)
+            return "\n".join(self._log_lines)
 
         except Exception as e:
             logger.error(f"Error reading log file: {e}")
+            self._log_offset = 0
             return f"[red]Error reading log file: {e}[/red]"
 
+    @staticmethod
+    def _format_lines(text: str) -> list[str]:
+        """Color code log lines by level, in one pass over the whole text."""
+        return _LEVEL_RE.sub(
+            lambda m: f"[{_LEVEL_STYLES[m.group(1)]}]{m.group(0)}[/]",
+            text,
+        ).splitlines()
+
+    @staticmethod
+    def _read_tail(log_file: Path, lines: int) -> tuple[str, int]:
+        """
+        Read the last lines of a file without reading the whole file.
+
+        Args:
+            log_file: File to read
+            lines: Number of lines wanted
+
+        Returns:
+            Text of up to `lines` complete lines from the end of the file, and
+            the offset just past the last of them
+        """
+        with open(log_file, 'rb') as f:
+            f.seek(0, 2)
+            size = f.tell()
+            window = LOG_TAIL_BYTES
+            while True:
+                start = max(0, size - window)
+                f.seek(start)
+                tail = f.read()
+                # One more newline than lines wanted means the first line is complete
+                if start == 0 or tail.count(b'\n') > lines:
+                    break
+                window *= 2
+
+        # A line still being written is left for the next read
+        complete = tail.rfind(b'\n') + 1
+        tail_lines = tail[:complete].decode('utf-8', errors='replace').splitlines()
+        if start > 0:
+            tail_lines = tail_lines[1:]  # Starts mid-line
+        return "\n".join(tail_lines[-lines:]), start + complete
+
+    @staticmethod
+    def _read_from(log_file: Path, offset: int) -> tuple[str, int]:
+        """
+        Read the complete lines appended to a file after offset.
+
+        Returns:
+            The new text, and the offset just past its last line
+        """
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            new = f.read()
+        complete = new.rfind(b'\n') + 1
+        return new[:complete].decode('utf-8', errors='replace'), offset + complete
+
     def render_logs(self) -> None:
         """Render the logs in the log content widget."""
         log_text = self.load_logs(lines=100)
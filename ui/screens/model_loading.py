@@ -6,7 +6,7 @@ Shows progress while a new model is being loaded.
 import logging
 from textual.screen import ModalScreen
 from textual.containers import Container, Vertical
-from textual.widgets import Static, Label
+from textual.widgets import Static, Label, LoadingIndicator
 from textual.app import ComposeResult
 from rich.text import Text
 
@@ -58,7 +58,7 @@ class ModelLoadingScreen(ModalScreen):
     }
 
     #spinner {
-        text-align: center;
+        height: 1;
         color: $accent;
         margin-bottom: 1;
     }
@@ -74,28 +74,20 @@ class ModelLoadingScreen(ModalScreen):
         super().__init__(**kwargs)
         self.model_name = model_name
         self.status_message = "Initializing..."
-        self.spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        self.spinner_index = 0
+        self.status_widget = Static(self.status_message, id="status-message")
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
         with Vertical(id="loading-dialog"):
             yield Label("🔄 Loading Model", id="loading-title")
             yield Label(self.model_name, id="model-name")
-            yield Static("", id="spinner")
-            yield Static(self.status_message, id="status-message")
+            # Repaints itself on its own auto_refresh timer, with no DOM query or update() per tick
+            yield LoadingIndicator(id="spinner")
+            yield self.status_widget
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
         logger.info(f"ModelLoadingScreen mounted for {self.model_name}")
-        # Update spinner animation every 100ms
-        self.set_interval(0.1, self.update_spinner)
-
-    def update_spinner(self) -> None:
-        """Update the spinner animation."""
-        spinner_widget = self.query_one("#spinner", Static)
-        spinner_widget.update(self.spinner_frames[self.spinner_index])
-        self.spinner_index = (self.spinner_index + 1) % len(self.spinner_frames)
 
     def update_status(self, message: str, error: bool = False) -> None:
         """
@@ -106,12 +98,11 @@ class ModelLoadingScreen(ModalScreen):
             error: Whether this is an error message
         """
         self.status_message = message
-        status_widget = self.query_one("#status-message", Static)
 
         if error:
             text = Text(message, style="bold red")
         else:
             text = Text(message, style="cyan")
 
-        status_widget.update(text)
-        logger.debug(f"Status updated: {message} (error={error})")
+        self.status_widget.update(text)
+        logger.debug("Status updated: %s (error=%s)", message, error)
@@ -3,6 +3,7 @@ Model selection screen for ctrlSPEAK.
 """
 
 import logging
+from functools import lru_cache
 from textual.screen import Screen
 from textual.containers import Container
 from textual.widgets import Static, Label, ListItem, ListView
@@ -12,10 +13,18 @@ from textual import on
 
 from ..state import AppState
 from models.factory import ModelFactory
+from utils.config import set_preferred_model
 
 logger = logging.getLogger("ctrlspeak.ui.model_selection")
 
 
+@lru_cache(maxsize=1)
+def _model_rows(model_aliases: tuple) -> tuple:
+    """(alias, full name) for each model; the model list doesn't change at runtime."""
+    aliases = ModelFactory._DEFAULT_ALIASES
+    return tuple((alias, aliases.get(alias, alias)) for alias in model_aliases)
+
+
 class ModelListItem(ListItem):
     """Custom list item for models."""
 
@@ -85,16 +94,19 @@ class ModelSelectionScreen(Screen):
             yield Label("🤖 Speech-to-Text Models", classes="screen-title")
             yield Label("Select a model for the next session:", classes="help-text")
 
-            # Create interactive list view with full model names
+            # Create interactive list view with full model names; only the
+            # loaded/selected flags are worked out on each open
+            loaded_model = self.app_state.loaded_model
+            selected_model = self.app_state.selected_model
             model_list = ListView(
                 *[
                     ModelListItem(
                         model_alias,
-                        ModelFactory._DEFAULT_ALIASES.get(model_alias, model_alias),
-                        is_loaded=(model_alias == self.app_state.loaded_model),  # Actually running
-                        is_selected=(model_alias == self.app_state.selected_model)  # Saved preference
+                        model_full_name,
+                        is_loaded=(model_alias == loaded_model),  # Actually running
+                        is_selected=(model_alias == selected_model)  # Saved preference
                     )
-                    for model_alias in self.app_state.available_models
+                    for model_alias, model_full_name in _model_rows(tuple(self.app_state.available_models))
                 ],
                 id="model-list"
             )
@@ -144,7 +156,6 @@ class ModelSelectionScreen(Screen):
 
         # Save preference to config for future launches
         try:
-            from utils.config import set_preferred_model
             set_preferred_model(selected_model)
             logger.info(f"Model preference saved: {selected_model}")
         except Exception as e:
@@ -161,6 +172,12 @@ class ModelSelectionScreen(Screen):
         else:
             logger.error(f"Hot swap to {selected_model} failed")
 
+    @on(ListView.Highlighted)
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Prefetch the highlighted model's files while the user decides."""
+        if isinstance(event.item, ModelListItem):
+            self.app.prefetch_model(event.item.model_alias)
+
     def on_mount(self) -> None:
         """Called when screen is mounted."""
         logger.info("ModelSelectionScreen mounted")
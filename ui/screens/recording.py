@@ -79,10 +79,4 @@ class RecordingScreen(Static):
     def on_mount(self) -> None:
         """Called when screen is mounted."""
         logger.info("RecordingScreen mounted")
-        # Set up periodic refresh for live updates
-        self.set_interval(0.1, self.refresh_display)
-
-    def refresh_display(self) -> None:
-        """Refresh display with current state."""
-        # The individual widgets will handle their own updates
-        self.refresh()
+        # No periodic refresh: the child widgets repaint themselves when their data changes
@@ -72,6 +72,11 @@ class SettingsScreen(Screen):
         super().__init__(**kwargs)
         self.app_state = app_state
         self.audio_manager = audio_manager
+        # Value labels, kept so refresh_values doesn't query for them every second
+        self.vad_value = Label(f"{self.app_state.vad_threshold:.0%}", classes="setting-value", id="vad-value")
+        self.silence_value = Label(f"{self.app_state.silence_duration_s:.1f}s", classes="setting-value", id="silence-value")
+        self.chunk_value = Label(f"{self.app_state.min_chunk_duration_s:.1f}s", classes="setting-value", id="chunk-value")
+        self.model_value = Label(f"{self.app_state.selected_model}", classes="setting-value", id="model-value")
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -81,7 +86,7 @@ class SettingsScreen(Screen):
             # VAD Threshold
             with Horizontal(classes="setting-row"):
                 yield Label("VAD Threshold:", classes="setting-label")
-                yield Label(f"{self.app_state.vad_threshold:.0%}", classes="setting-value", id="vad-value")
+                yield self.vad_value
 
             yield Label(
                 "Silero VAD speech probability threshold (0-100%)",
@@ -91,7 +96,7 @@ class SettingsScreen(Screen):
             # Silence Duration
             with Horizontal(classes="setting-row"):
                 yield Label("Silence Duration:", classes="setting-label")
-                yield Label(f"{self.app_state.silence_duration_s:.1f}s", classes="setting-value", id="silence-value")
+                yield self.silence_value
 
             yield Label(
                 "Time of silence before segmenting (0.5s - 5.0s)",
@@ -101,7 +106,7 @@ class SettingsScreen(Screen):
             # Minimum Chunk Duration
             with Horizontal(classes="setting-row"):
                 yield Label("Min Chunk Duration:", classes="setting-label")
-                yield Label(f"{self.app_state.min_chunk_duration_s:.1f}s", classes="setting-value", id="chunk-value")
+                yield self.chunk_value
 
             yield Label(
                 "Minimum recording length to transcribe (0.1s - 2.0s)",
@@ -111,7 +116,7 @@ class SettingsScreen(Screen):
             # Model
             with Horizontal(classes="setting-row"):
                 yield Label("Model:", classes="setting-label")
-                yield Label(f"{self.app_state.selected_model}", classes="setting-value", id="model-value")
+                yield self.model_value
 
             yield Label(
                 "Speech recognition model (set with --model flag)",
@@ -138,9 +143,9 @@ class SettingsScreen(Screen):
         """Refresh displayed values from app state."""
         try:
             if self.app_state:
-                self.query_one("#vad-value", Label).update(f"{self.app_state.vad_threshold:.0%}")
-                self.query_one("#silence-value", Label).update(f"{self.app_state.silence_duration_s:.1f}s")
-                self.query_one("#chunk-value", Label).update(f"{self.app_state.min_chunk_duration_s:.1f}s")
-                self.query_one("#model-value", Label).update(f"{self.app_state.selected_model}")
+                self.vad_value.update(f"{self.app_state.vad_threshold:.0%}")
+                self.silence_value.update(f"{self.app_state.silence_duration_s:.1f}s")
+                self.chunk_value.update(f"{self.app_state.min_chunk_duration_s:.1f}s")
+                self.model_value.update(f"{self.app_state.selected_model}")
         except Exception as e:
             logger.debug(f"Error refreshing settings values: {e}")
@@ -3,7 +3,7 @@ Centralized application state for ctrlSPEAK Textual UI.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from models.factory import ModelFactory
 
@@ -37,7 +37,8 @@ class AppState:
         # Device state
         self.selected_device: Optional[int] = None  # Device preference (saved for next launch)
         self.loaded_device: Optional[int] = None     # Actually active device (current runtime state)
-        self.available_devices: List[DeviceInfo] = []
+        self.available_devices: List[DeviceInfo] = []  # Last enumeration, reused while fresh
+        self.devices_enumerated_at: Optional[float] = None  # time.monotonic() of that enumeration
 
         # Settings state
         self.vad_threshold: float = 0.5  # Silero VAD speech probability threshold
@@ -55,12 +56,40 @@ class AppState:
         self.current_screen: str = "recording"
         self.transcription_text: str = ""
         self.last_transcription: str = ""
-        self.accumulated_text: str = ""  # Text buffer that accumulates until next triple-tap
+        # Text buffer that accumulates until next triple-tap, kept as parts so
+        # appending a chunk doesn't copy the whole transcript (see accumulated_text)
+        self._accum_parts: List[str] = []
+        self._accum_text: Optional[str] = ""  # Joined parts, None when stale
 
         # Statistics
         self.total_transcriptions: int = 0
         self.total_recording_time_s: float = 0.0
 
+    @property
+    def accumulated_text(self) -> str:
+        """Accumulated transcription, joined from its parts on first read after a change."""
+        if self._accum_text is None:
+            self._accum_text = " ".join(self._accum_parts)
+        return self._accum_text
+
+    @accumulated_text.setter
+    def accumulated_text(self, value: str) -> None:
+        # Stripped once here, so neither appends nor renders need to re-strip it
+        value = value.strip() if value else ""
+        self._accum_parts = [value] if value else []
+        self._accum_text = value
+
+    def append_text(self, parts: Iterable[str]) -> None:
+        """Append already-stripped, non-empty text parts, separated by spaces."""
+        count = len(self._accum_parts)
+        self._accum_parts.extend(parts)
+        if len(self._accum_parts) != count:
+            self._accum_text = None
+
+    def invalidate_devices(self) -> None:
+        """Make the next device list lookup re-enumerate PortAudio devices."""
+        self.devices_enumerated_at = None
+
     def reset_recording_state(self):
         """Reset recording-specific state."""
         self.is_recording = False
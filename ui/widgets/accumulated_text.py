@@ -35,10 +35,10 @@ class AccumulatedTextWidget(Static):
         # Get accumulated text
         text_content = self.app_state.accumulated_text if self.app_state else ""
 
-        logger.debug(f"AccumulatedTextWidget.render() - content length: {len(text_content) if text_content else 0}")
+        logger.debug("AccumulatedTextWidget.render() - content length: %d", len(text_content))
 
-        # If no text yet, show placeholder
-        if not text_content or not text_content.strip():
+        # If no text yet, show placeholder (AppState keeps the text stripped)
+        if not text_content:
             content = Text(
                 "Transcribed text will appear here as segments are captured...",
                 style="dim cyan"
@@ -59,5 +59,4 @@ class AccumulatedTextWidget(Static):
     def on_mount(self) -> None:
         """Called when widget is mounted."""
         logger.debug("AccumulatedTextWidget mounted")
-        # Refresh frequently to show new text immediately
-        self.set_interval(0.2, self.refresh)
+        # No polling: CtrlSpeakApp.update_recording_state refreshes this widget when the text changes
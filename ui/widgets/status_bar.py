@@ -32,6 +32,7 @@ class RecordingStatusWidget(Static):
         """
         super().__init__(**kwargs)
         self.app_state = app_state
+        self._rendered_snapshot = None  # State the current render was drawn from
 
     def render(self) -> Text:
         """Render the recording status display."""
@@ -63,5 +64,15 @@ class RecordingStatusWidget(Static):
     def on_mount(self) -> None:
         """Called when widget is mounted."""
         logger.debug("RecordingStatusWidget mounted")
-        # Fast refresh for smooth timer and pulse animation
-        self.set_interval(0.1, self.refresh)
+        # Fast tick for a smooth timer and pulse, repainting only when they change
+        self.set_interval(0.1, self._refresh_if_changed)
+
+    def _refresh_if_changed(self) -> None:
+        """Repaint when recording starts/stops or the pulse/timer advances (every half second)."""
+        if self.app_state.is_recording:
+            snapshot = (True, self.app_state.recording_start_time, int(time.time() * 2))
+        else:
+            snapshot = (False,)
+        if snapshot != self._rendered_snapshot:
+            self._rendered_snapshot = snapshot
+            self.refresh()
@@ -34,6 +34,7 @@ class WaveformDisplay(Static):
         super().__init__(**kwargs)
         self.app_state = app_state
         self.bar_width = 50  # Width of the bar graph
+        self._rendered_snapshot = None  # State the current render was drawn from
 
     def _get_device_name(self) -> str:
         """Get the name of the currently loaded (active) device."""
@@ -110,5 +111,19 @@ class WaveformDisplay(Static):
     def on_mount(self) -> None:
         """Called when widget is mounted."""
         logger.debug("WaveformDisplay mounted")
-        # Set up periodic refresh for animation
-        self.set_interval(0.05, self.refresh)  # 20 FPS
+        # Sample the audio state for animation, repainting only when it changed
+        self.set_interval(0.05, self._refresh_if_changed)  # 20 FPS
+
+    def _snapshot(self) -> tuple:
+        """The app state render() draws from (levels only matter while recording)."""
+        app_state = self.app_state
+        if not app_state.is_recording:
+            return (False, app_state.loaded_device)
+        return (True, app_state.loaded_device, app_state.current_vad_prob, app_state.current_rms)
+
+    def _refresh_if_changed(self) -> None:
+        """Repaint if the state shown has changed since the last repaint."""
+        snapshot = self._snapshot()
+        if snapshot != self._rendered_snapshot:
+            self._rendered_snapshot = snapshot
+            self.refresh()
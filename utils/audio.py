@@ -4,6 +4,7 @@ Audio functionality for ctrlSPEAK.
 """
 import sounddevice as sd
 import numpy as np
+import math
 import time
 import logging
 from queue import Queue
@@ -27,6 +28,31 @@ logger = logging.getLogger("ctrlspeak.audio")
 SAMPLE_RATE = 16000  # NeMo expects 16kHz
 CHANNELS = 1
 
+
+def compute_rms(samples):
+    """Return the RMS level of a block of float32 samples.
+
+    Sums the squares with one dot product instead of materializing samples**2.
+    """
+    flat = samples.reshape(-1)
+    if flat.size == 0:
+        return 0.0
+    return math.sqrt(float(flat @ flat) / flat.size)
+
+
+def encode_pcm16(samples):
+    """Quantize float32 samples to 16-bit PCM.
+
+    Same mapping libsndfile (1.1+) uses when writing float data to a PCM_16
+    file: scale by 32768, round down, clip. All work happens in one float32
+    scratch buffer.
+    """
+    pcm = np.multiply(samples, 32768, dtype=np.float32)
+    np.floor(pcm, out=pcm)
+    np.clip(pcm, -32768, 32767, out=pcm)
+    return pcm.astype(np.int16)
+
+
 class AudioManager:
     """Class to manage audio recording and state.
 
@@ -66,7 +92,8 @@ class AudioManager:
         self._streaming_mode = False
         self._streaming_callback = None  # Function to call with each chunk
         self._streaming_chunk_size_samples = 0  # Samples per chunk
-        self._streaming_buffer = []  # Buffer for accumulating streaming chunks
+        self._streaming_buffer = None  # Pre-allocated float32 buffer of one chunk
+        self._streaming_fill = 0  # Number of valid samples in _streaming_buffer
 
         # Silero VAD state
         self._vad_model = None
@@ -216,8 +243,8 @@ class AudioManager:
 
         # Calculate RMS for UI feedback (keeping this for visualization)
         try:
-            rms = np.sqrt(np.mean(chunk_flat**2))
-            logger.debug(f"RMS: {rms:.6f}")
+            rms = compute_rms(chunk_flat)
+            logger.debug("RMS: %.6f", rms)
             self.last_rms = rms
 
             # Update app_state if available (for Textual UI)
@@ -394,7 +421,8 @@ class AudioManager:
         self._streaming_mode = True
         self._streaming_callback = on_chunk_callback
         self._streaming_chunk_size_samples = int(SAMPLE_RATE * chunk_size_ms / 1000)
-        self._streaming_buffer = []
+        self._streaming_buffer = np.empty(self._streaming_chunk_size_samples, dtype=np.float32)
+        self._streaming_fill = 0
 
         # Reset standard buffer and state
         self.reset_collected_audio()
@@ -428,11 +456,10 @@ class AudioManager:
         self.console.line()
 
         # Process any remaining audio in the streaming buffer
-        if self._streaming_buffer and self._streaming_callback:
-            remaining_samples = sum(len(c) for c in self._streaming_buffer)
-            if remaining_samples > 0:
-                # Concatenate remaining buffer
-                remaining_audio = np.concatenate(self._streaming_buffer).flatten()
+        if self._streaming_buffer is not None and self._streaming_callback:
+            if self._streaming_fill > 0:
+                # Copy out the partial chunk (the consumer may process it asynchronously)
+                remaining_audio = self._streaming_buffer[:self._streaming_fill].copy()
                 duration_ms = len(remaining_audio) / SAMPLE_RATE * 1000
                 logger.info(f"[AUDIO_STOP] Final buffer: {len(remaining_audio)} samples ({duration_ms:.0f}ms)")
                 try:
@@ -444,12 +471,13 @@ class AudioManager:
             else:
                 logger.info("[AUDIO_STOP] No remaining samples in buffer")
         else:
-            logger.info(f"[AUDIO_STOP] No final buffer to process (buffer={bool(self._streaming_buffer)}, callback={bool(self._streaming_callback)})")
+            logger.info(f"[AUDIO_STOP] No final buffer to process (buffer={self._streaming_buffer is not None}, callback={bool(self._streaming_callback)})")
 
         # Reset streaming state
         self._streaming_mode = False
         self._streaming_callback = None
-        self._streaming_buffer = []
+        self._streaming_buffer = None
+        self._streaming_fill = 0
         self._streaming_chunk_size_samples = 0
 
         # Clear standard buffer and state
@@ -468,39 +496,32 @@ class AudioManager:
         if chunk.ndim > 1:
             chunk = chunk.flatten()
 
-        # Add to streaming buffer
-        self._streaming_buffer.append(chunk)
-
-        # Calculate total samples in buffer
-        total_samples = sum(len(c) for c in self._streaming_buffer)
-
         # Calculate RMS for UI feedback
         try:
-            rms = np.sqrt(np.mean(chunk**2))
+            rms = compute_rms(chunk)
             self.last_rms = rms
             if self.app_state:
                 self.app_state.current_rms = rms
         except Exception as e:
             logger.debug(f"Error calculating RMS in streaming mode: {e}")
 
-        # Check if we have enough samples for a chunk
-        if total_samples >= self._streaming_chunk_size_samples:
-            # Concatenate buffer
-            audio_data = np.concatenate(self._streaming_buffer).flatten()
-
-            # Take exactly chunk_size samples
-            chunk_samples = audio_data[:self._streaming_chunk_size_samples]
+        # Copy into the fixed-size chunk buffer (float32 conversion happens on assignment);
+        # a callback block can straddle a chunk boundary, so fill in pieces
+        chunk_size = self._streaming_chunk_size_samples
+        offset = 0
+        while offset < len(chunk):
+            n = min(len(chunk) - offset, chunk_size - self._streaming_fill)
+            self._streaming_buffer[self._streaming_fill:self._streaming_fill + n] = chunk[offset:offset + n]
+            self._streaming_fill += n
+            offset += n
 
-            # Keep remainder in buffer
-            remainder = audio_data[self._streaming_chunk_size_samples:]
-            if len(remainder) > 0:
-                self._streaming_buffer = [remainder]
-            else:
-                self._streaming_buffer = []
+            if self._streaming_fill < chunk_size:
+                continue
 
-            # Ensure float32 in range [-1, 1]
-            if chunk_samples.dtype != np.float32:
-                chunk_samples = chunk_samples.astype(np.float32)
+            # Exactly chunk_size samples: hand off a copy, since the buffer is reused
+            # while the consumer may still be processing the chunk on another thread
+            chunk_samples = self._streaming_buffer.copy()
+            self._streaming_fill = 0
 
             # Call the streaming callback
             if self._streaming_callback:
@@ -531,7 +552,8 @@ class AudioManager:
         device = self.input_device if self.input_device is not None else None
         if device is not None:
             logger.info(f"Using audio device: {device}")
-        stream = sd.InputStream(device=device, samplerate=SAMPLE_RATE, channels=CHANNELS, callback=self.audio_callback)
+        stream = sd.InputStream(device=device, samplerate=SAMPLE_RATE, channels=CHANNELS, dtype='float32',
+                                callback=self.audio_callback)
         self.current_stream = stream
         return stream
 
@@ -572,6 +594,7 @@ class AudioManager:
                 device=device,
                 samplerate=SAMPLE_RATE,
                 channels=CHANNELS,
+                dtype='float32',
                 callback=self.audio_callback
             )
 
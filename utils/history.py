@@ -7,15 +7,23 @@ Stores transcription history in SQLite database for later review.
 import sqlite3
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Iterable, Iterator
+from dataclasses import dataclass, field
+
+from rich.text import Text
 
 logger = logging.getLogger("ctrlspeak.history")
 
 # Schema version for migrations
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
+
+# Words in a text, counted as spaces + 1 (shared by get_stats and its triggers)
+_WORD_COUNT_SQL = "(LENGTH({text}) - LENGTH(REPLACE({text}, ' ', '')) + 1)"
 
 # Default history database location
 HISTORY_DB_PATH = Path.home() / ".ctrlspeak" / "history.db"
@@ -30,6 +38,11 @@ class HistoryEntry:
     model: str
     duration_seconds: float
     language: str
+    # First 60 chars of text for the history list, set once in __post_init__
+    short_preview: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.short_preview = self.text[:60] + "..." if len(self.text) > 60 else self.text
 
     @property
     def formatted_timestamp(self) -> str:
@@ -47,6 +60,24 @@ class HistoryEntry:
             return self.text
         return self.text[:97] + "..."
 
+    @cached_property
+    def display_text(self) -> Text:
+        """
+        Return the styled text shown for this entry in the history list.
+
+        Format: timestamp | model | duration, then short_preview. Built with
+        Text.assemble so nothing is markup-parsed (and brackets in the
+        transcription show as typed). Entries don't change once loaded, so
+        it's built only once.
+        """
+        duration_str = f"{self.duration_seconds:.1f}s"
+        return Text.assemble(
+            (self.formatted_timestamp, "cyan"), " | ",
+            (self.model, "dim"), " | ",
+            (duration_str, "yellow"), "\n  ",
+            self.short_preview,
+        )
+
 
 class HistoryManager:
     """Manages transcription history storage and retrieval."""
@@ -59,8 +90,42 @@ class HistoryManager:
             db_path: Path to SQLite database (defaults to ~/.ctrlspeak/history.db)
         """
         self.db_path = db_path or HISTORY_DB_PATH
+        self._conn: Optional[sqlite3.Connection] = None
+        # Entries are added from the hotkey thread while the UI reads and deletes
+        self._lock = threading.Lock()
+        # Bumped on every write through this manager; get_stats is cached per version
+        self._version = 0
+        self._stats_cache: Optional[tuple] = None  # (version, stats)
         self._ensure_db_exists()
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Use the shared connection to the history database.
+
+        One connection is kept open for the manager's lifetime, so sqlite3's
+        statement cache keeps the queries below compiled between calls. Access
+        is serialized with a lock; the transaction is committed on success and
+        rolled back on error, as with ``with sqlite3.connect(...)``.
+
+        The database runs in WAL mode (set once in ``_ensure_db_exists``), where
+        ``synchronous=NORMAL`` is still crash-safe and skips the per-commit fsync.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute("PRAGMA temp_store=MEMORY")
+                self._conn.execute("PRAGMA mmap_size=134217728")
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """Close the database connection (it's reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _ensure_db_exists(self) -> None:
         """Create database and table if they don't exist."""
         try:
@@ -70,7 +135,10 @@ class HistoryManager:
             os.chmod(db_dir, 0o700)
 
             # Create or migrate database
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
+                # WAL is persistent, so setting it here covers every later connection
+                conn.execute("PRAGMA journal_mode=WAL")
+
                 # Check schema version
                 current_version = self._get_schema_version(conn)
 
@@ -78,8 +146,7 @@ class HistoryManager:
                     # New database - create schema
                     self._create_schema(conn)
                 elif current_version < SCHEMA_VERSION:
-                    # Future: run migrations here
-                    logger.warning(f"Schema version {current_version} < {SCHEMA_VERSION}. Migrations not yet implemented.")
+                    self._migrate_schema(conn, current_version)
 
                 conn.commit()
                 logger.debug(f"History database initialized at {self.db_path}")
@@ -124,8 +191,58 @@ class HistoryManager:
             CREATE INDEX idx_timestamp ON history(timestamp DESC)
         """)
 
+        self._create_stats_table(conn)
+
         logger.info(f"Created history database schema version {SCHEMA_VERSION}")
 
+    def _create_stats_table(self, conn: sqlite3.Connection) -> None:
+        """
+        Create the single-row history_stats table and the triggers that keep it
+        current, so get_stats doesn't aggregate the whole history table.
+        """
+        conn.execute("""
+            CREATE TABLE history_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_entries INTEGER NOT NULL,
+                total_words INTEGER NOT NULL,
+                total_duration REAL NOT NULL
+            )
+        """)
+        # Seeded from whatever is already there (nothing, for a new database)
+        conn.execute(f"""
+            INSERT INTO history_stats (id, total_entries, total_words, total_duration)
+            SELECT 1, COUNT(*), COALESCE(SUM({_WORD_COUNT_SQL.format(text='text')}), 0),
+                   COALESCE(SUM(duration_seconds), 0.0)
+            FROM history
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER history_stats_insert AFTER INSERT ON history
+            BEGIN
+                UPDATE history_stats SET
+                    total_entries = total_entries + 1,
+                    total_words = total_words + {_WORD_COUNT_SQL.format(text='NEW.text')},
+                    total_duration = total_duration + COALESCE(NEW.duration_seconds, 0.0)
+                WHERE id = 1;
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER history_stats_delete AFTER DELETE ON history
+            BEGIN
+                UPDATE history_stats SET
+                    total_entries = total_entries - 1,
+                    total_words = total_words - {_WORD_COUNT_SQL.format(text='OLD.text')},
+                    total_duration = total_duration - COALESCE(OLD.duration_seconds, 0.0)
+                WHERE id = 1;
+            END
+        """)
+
+    def _migrate_schema(self, conn: sqlite3.Connection, from_version: int) -> None:
+        """Bring an older database up to SCHEMA_VERSION."""
+        if from_version < 2:
+            self._create_stats_table(conn)
+        conn.execute("UPDATE schema_version SET version = ?", (SCHEMA_VERSION,))
+        logger.info(f"Migrated history database schema from version {from_version} to {SCHEMA_VERSION}")
+
     def add_entry(
         self,
         text: str,
@@ -145,22 +262,25 @@ class HistoryManager:
         Returns:
             ID of inserted entry, or None if failed
         """
-        if not text or not text.strip():
+        # Rejected before any database work
+        text = text.strip() if text else ""
+        if not text:
             logger.warning("Attempted to save empty transcription to history")
             return None
 
         try:
             timestamp = datetime.now().isoformat()
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute(
                     """
                     INSERT INTO history (timestamp, text, model, duration_seconds, language)
                     VALUES (?, ?, ?, ?, ?)
                     """,
-                    (timestamp, text.strip(), model, duration_seconds, language)
+                    (timestamp, text, model, duration_seconds, language)
                 )
                 conn.commit()
+                self._version += 1
                 entry_id = cursor.lastrowid
                 logger.info(f"Saved transcription to history (ID: {entry_id}, length: {len(text)} chars)")
                 return entry_id
@@ -169,6 +289,56 @@ class HistoryManager:
             logger.error(f"Error saving to history: {e}", exc_info=True)
             return None
 
+    def add_entries(self, entries: Iterable[Dict[str, Any]]) -> List[int]:
+        """
+        Add several transcriptions to history in a single transaction.
+
+        Args:
+            entries: Dicts with the same keys as ``add_entry`` arguments
+                     (``text``, ``model`` and optionally ``duration_seconds``, ``language``)
+
+        Returns:
+            IDs of inserted entries, in order. Empty texts are skipped; on error
+            nothing is saved and an empty list is returned.
+        """
+        rows = []
+        for entry in entries:
+            text = entry.get("text")
+            if not text or not text.strip():
+                logger.warning("Skipping empty transcription in history batch")
+                continue
+            rows.append((
+                datetime.now().isoformat(),
+                text.strip(),
+                entry["model"],
+                entry.get("duration_seconds", 0.0),
+                entry.get("language", "en"),
+            ))
+
+        if not rows:
+            return []
+
+        try:
+            with self._connect() as conn:
+                entry_ids = []
+                for row in rows:
+                    cursor = conn.execute(
+                        """
+                        INSERT INTO history (timestamp, text, model, duration_seconds, language)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        row
+                    )
+                    entry_ids.append(cursor.lastrowid)
+                conn.commit()
+                self._version += 1
+                logger.info(f"Saved {len(entry_ids)} transcriptions to history")
+                return entry_ids
+
+        except Exception as e:
+            logger.error(f"Error saving to history: {e}", exc_info=True)
+            return []
+
     def get_recent(self, limit: int = 100) -> List[HistoryEntry]:
         """
         Get recent transcription history entries.
@@ -177,19 +347,46 @@ class HistoryManager:
             limit: Maximum number of entries to return
 
         Returns:
-            List of HistoryEntry objects, most recent first
+            List of HistoryEntry objects, most recent first (ties on
+            timestamp are broken by insertion order)
+        """
+        return self.get_page(limit)
+
+    def get_page(self, limit: int = 100, after: Optional[HistoryEntry] = None) -> List[HistoryEntry]:
+        """
+        Get one page of history entries, most recent first.
+
+        Pages are keyed on the last entry already shown rather than an offset,
+        so SQLite seeks straight to the page through the timestamp index and
+        entries added or deleted meanwhile don't shift the next page.
+
+        Args:
+            limit: Maximum number of entries to return
+            after: Last entry of the previous page, or None for the first page
+
+        Returns:
+            List of HistoryEntry objects older than ``after`` (same order as
+            get_recent)
         """
+        if after is None:
+            where, params = "", ()
+        else:
+            # Written as one range on timestamp so the timestamp index is used
+            where = "WHERE timestamp <= ? AND NOT (timestamp = ? AND id >= ?)"
+            params = (after.timestamp, after.timestamp, after.id)
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
-                    """
+                    f"""
                     SELECT id, timestamp, text, model, duration_seconds, language
                     FROM history
-                    ORDER BY timestamp DESC
+                    {where}
+                    ORDER BY timestamp DESC, id DESC
                     LIMIT ?
                     """,
-                    (limit,)
+                    (*params, limit)
                 )
                 rows = cursor.fetchall()
 
@@ -223,7 +420,7 @@ class HistoryManager:
             HistoryEntry object or None if not found
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     """
@@ -262,9 +459,10 @@ class HistoryManager:
             True if deleted successfully, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute("DELETE FROM history WHERE id = ?", (entry_id,))
                 conn.commit()
+                self._version += 1
 
                 if cursor.rowcount > 0:
                     logger.info(f"Deleted history entry {entry_id}")
@@ -285,9 +483,12 @@ class HistoryManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute("DELETE FROM history")
+                # Start from exact zeros rather than the sum of float subtractions
+                conn.execute("UPDATE history_stats SET total_entries = 0, total_words = 0, total_duration = 0.0")
                 conn.commit()
+                self._version += 1
                 logger.info("Cleared all history entries")
                 return True
 
@@ -299,25 +500,32 @@ class HistoryManager:
         """
         Get statistics about transcription history.
 
+        Reads the totals kept by the history_stats triggers, so the cost
+        doesn't grow with the number of entries. The result is reused until
+        this manager next writes to the database.
+
         Returns:
             Dictionary with statistics (total entries, total words, etc.)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
+                if self._stats_cache is not None and self._stats_cache[0] == self._version:
+                    return dict(self._stats_cache[1])
+
                 cursor = conn.execute("""
-                    SELECT
-                        COUNT(*) as total_entries,
-                        SUM(LENGTH(text) - LENGTH(REPLACE(text, ' ', '')) + 1) as total_words,
-                        SUM(duration_seconds) as total_duration
-                    FROM history
+                    SELECT total_entries, total_words, total_duration
+                    FROM history_stats
+                    WHERE id = 1
                 """)
-                row = cursor.fetchone()
+                row = cursor.fetchone() or (0, 0, 0.0)
 
-                return {
+                stats = {
                     "total_entries": row[0] or 0,
                     "total_words": row[1] or 0,
                     "total_duration": row[2] or 0.0
                 }
+                self._stats_cache = (self._version, stats)
+                return dict(stats)
 
         except Exception as e:
             logger.error(f"Error getting stats: {e}", exc_info=True)
@@ -343,3 +551,9 @@ def get_history_manager(db_path: Optional[Path] = None) -> HistoryManager:
     if _history_manager is None:
         _history_manager = HistoryManager(db_path=db_path)
     return _history_manager
+
+
+def close_history_manager() -> None:
+    """Close the global history manager's connection, if one was created."""
+    if _history_manager is not None:
+        _history_manager.close()
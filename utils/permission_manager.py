@@ -83,8 +83,8 @@ def detect_parent_app():
     """
     global _parent_app
     
-    # Return cached result if available
-    if _parent_app:
+    # Return cached result if available (even an empty one - the ps lookup won't change)
+    if _parent_app is not None:
         return _parent_app
     
     # First check if TERM_PROGRAM environment variable is set